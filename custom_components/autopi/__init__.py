@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -35,45 +37,74 @@ from .coordinator import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Third-party loggers that are too verbose outside of debug sessions
+_THIRD_PARTY_LOGGERS: tuple[str, ...] = ("aiohttp",)
+
+# Child loggers only inherit the parent level while their own level is NOTSET,
+# so pin the chattiest ones explicitly. They keep propagating to the parent.
+_THIRD_PARTY_CHILD_LOGGERS: tuple[str, ...] = ("aiohttp.client", "aiohttp.internal")
+
 
 # Suppress verbose logging from third-party libraries
 def _setup_logging() -> None:
     """Configure logging to suppress verbose third-party output."""
-    third_party_loggers = [
-        "aiohttp",
-    ]
-
-    if _LOGGER.getEffectiveLevel() > logging.DEBUG:
-        for logger_name in third_party_loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.ERROR)
-            logger.propagate = False
-
-    _LOGGER.debug(
-        "Configured logging for %d third-party libraries", len(third_party_loggers)
-    )
+    # Leave third-party loggers alone while debugging the integration
+    if _LOGGER.getEffectiveLevel() <= logging.DEBUG:
+        return
+
+    for logger_name in _THIRD_PARTY_LOGGERS:
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.ERROR)
+        logger.propagate = False
+
+    for logger_name in _THIRD_PARTY_CHILD_LOGGERS:
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
 
 
 # Initialize logging configuration
 _setup_logging()
 
 
-def _format_vehicle_summary(vehicles: list[AutoPiVehicle], limit: int = 10) -> str:
-    """Format vehicle summaries for concise logging."""
+@dataclass(slots=True)
+class AutoPiEntryData:
+    """Per-entry runtime data stored in hass.data."""
+
+    base: AutoPiDataUpdateCoordinator
+    position: AutoPiPositionCoordinator
+    trip: AutoPiTripCoordinator
+    # Fast update interval (minutes) the coordinators were created with
+    update_interval_minutes: int
+
+    @property
+    def coordinators(self) -> dict[str, AutoPiDataUpdateCoordinator]:
+        """Return the coordinators keyed by role."""
+        return {"base": self.base, "position": self.position, "trip": self.trip}
+
+
+def _format_vehicle_summary(
+    vehicles: list[AutoPiVehicle], limit: int = 10
+) -> tuple[str, int]:
+    """Format vehicle summaries for concise logging.
+
+    Returns the summary together with the total device count so callers
+    only walk the vehicle list once.
+    """
     if not vehicles:
-        return "none"
+        return "none", 0
 
     entries = []
-    for vehicle in vehicles[:limit]:
-        name = vehicle.name or "Unknown"
-        entries.append(f"{name} (id={vehicle.id})")
+    total_devices = 0
+    for index, vehicle in enumerate(vehicles):
+        total_devices += len(vehicle.devices)
+        if index < limit:
+            entries.append(f"{vehicle.name or 'Unknown'} (id={vehicle.id})")
 
     summary = ", ".join(entries)
     remaining = len(vehicles) - limit
     if remaining > 0:
         summary = f"{summary}, and {remaining} more"
 
-    return summary
+    return summary, total_devices
 
 
 def _format_selected_vehicle_summary(
@@ -83,17 +114,18 @@ def _format_selected_vehicle_summary(
     if not selected_vehicle_ids:
         return "all"
 
-    normalized_ids = [str(vehicle_id) for vehicle_id in selected_vehicle_ids]
-    summary = ", ".join(normalized_ids[:limit])
-    remaining = len(normalized_ids) - limit
+    # Only the displayed IDs need converting to strings
+    total = len(selected_vehicle_ids)
+    summary = ", ".join(str(vehicle_id) for vehicle_id in selected_vehicle_ids[:limit])
+    remaining = total - limit
     if remaining > 0:
         summary = f"{summary}, and {remaining} more"
 
-    return f"{len(normalized_ids)} ({summary})"
+    return f"{total} ({summary})"
 
 
 def _format_unsupported_endpoints_summary(
-    coordinators: list[AutoPiDataUpdateCoordinator],
+    coordinators: tuple[AutoPiDataUpdateCoordinator, ...],
     vehicles_by_id: dict[str, AutoPiVehicle],
 ) -> str | None:
     """Format unsupported endpoint summary across coordinators."""
@@ -135,9 +167,13 @@ def _format_unsupported_endpoints_summary(
 def _log_startup_summary(
     entry: ConfigEntry,
     coordinator: AutoPiDataUpdateCoordinator,
-    coordinators: list[AutoPiDataUpdateCoordinator],
+    coordinators: tuple[AutoPiDataUpdateCoordinator, ...],
 ) -> None:
     """Log a one-time startup summary at info level."""
+    # Everything below only builds log arguments
+    if not _LOGGER.isEnabledFor(logging.INFO):
+        return
+
     options = entry.options
     data = entry.data
 
@@ -170,7 +206,7 @@ def _log_startup_summary(
     )
 
     vehicles = coordinator.all_vehicles or []
-    total_devices = sum(len(vehicle.devices) for vehicle in vehicles)
+    vehicle_summary, total_devices = _format_vehicle_summary(vehicles)
     selected_count = coordinator.get_vehicle_count()
 
     _LOGGER.info(
@@ -178,7 +214,7 @@ def _log_startup_summary(
         len(vehicles),
         selected_count,
         total_devices,
-        _format_vehicle_summary(vehicles),
+        vehicle_summary,
     )
 
     unsupported_summary = _format_unsupported_endpoints_summary(
@@ -205,73 +241,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Raises:
         ConfigEntryNotReady: If unable to connect to AutoPi API
     """
-    _LOGGER.debug("Setting up AutoPi integration (entry_id: %s)", entry.entry_id)
+    # Only pay for formatting debug arguments when debug logging is enabled
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
-    _LOGGER.debug(
-        "Integration setup started - Entry ID: %s, Title: %s, Domain: %s",
-        entry.entry_id,
-        entry.title,
-        entry.domain,
-    )
-
-    # Create coordinators dictionary
-    coordinators = {}
+    if debug_enabled:
+        _LOGGER.debug("Setting up AutoPi integration (entry_id: %s)", entry.entry_id)
+        _LOGGER.debug(
+            "Integration setup started - Entry ID: %s, Title: %s, Domain: %s",
+            entry.entry_id,
+            entry.title,
+            entry.domain,
+        )
 
     # Create the base coordinator for vehicle data
-    _LOGGER.debug("Creating base vehicle data coordinator")
+    if debug_enabled:
+        _LOGGER.debug("Creating base vehicle data coordinator")
     coordinator = AutoPiDataUpdateCoordinator(hass, entry)
-    coordinators["base"] = coordinator
 
     # Perform initial data fetch
     try:
-        _LOGGER.debug("Performing initial data fetch for base vehicle data")
+        if debug_enabled:
+            _LOGGER.debug("Performing initial data fetch for base vehicle data")
         await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug(
-            "Initial data fetch successful, found %d vehicles",
-            coordinator.get_vehicle_count(),
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                "Initial data fetch successful, found %d vehicles",
+                coordinator.get_vehicle_count(),
+            )
     except UpdateFailed as err:
         _LOGGER.exception("Failed to fetch initial data")
         raise ConfigEntryNotReady(f"Unable to connect to AutoPi API: {err}") from err
 
     # Create position coordinator (independent of base coordinator)
-    _LOGGER.debug("Creating position data coordinator")
+    if debug_enabled:
+        _LOGGER.debug("Creating position data coordinator")
     position_coordinator = AutoPiPositionCoordinator(hass, entry, coordinator)
-    coordinators["position"] = position_coordinator
-
-    # Perform initial position data fetch in parallel
-    try:
-        _LOGGER.debug("Performing initial position data fetch")
-        await position_coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("Initial position data fetch successful")
-    except UpdateFailed:
-        # Position fetch failures are not critical
-        _LOGGER.warning("Failed to fetch initial position data")
 
     # Create trip coordinator
-    _LOGGER.debug("Creating trip data coordinator")
+    if debug_enabled:
+        _LOGGER.debug("Creating trip data coordinator")
     trip_coordinator = AutoPiTripCoordinator(hass, entry, coordinator)
-    coordinators["trip"] = trip_coordinator
 
-    # Perform initial trip data fetch
-    try:
-        _LOGGER.debug("Performing initial trip data fetch")
-        await trip_coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("Initial trip data fetch successful")
-    except UpdateFailed:
-        # Trip fetch failures are not critical
-        _LOGGER.warning("Failed to fetch initial trip data")
-
-    _log_startup_summary(
-        entry,
-        coordinator,
-        [coordinator, position_coordinator, trip_coordinator],
+    # Initialize auto-zero manager with storage. The position refresh below
+    # evaluates auto-zero, so persisted state must be loaded before it runs.
+    # Loading is skipped unless the feature is enabled; async_update_options
+    # covers the feature being switched on later.
+    if entry.options.get(CONF_AUTO_ZERO_ENABLED, False):
+        if debug_enabled:
+            _LOGGER.debug("[AUTO-ZERO INIT] Initializing auto-zero manager")
+        await get_auto_zero_manager().async_initialize(hass)
+        if debug_enabled:
+            _LOGGER.debug("[AUTO-ZERO INIT] Auto-zero manager initialized")
+    elif debug_enabled:
+        _LOGGER.debug("[AUTO-ZERO INIT] Auto-zero disabled, skipping initialization")
+
+    # Position and trip data only depend on the base vehicle list, so fetch
+    # them concurrently rather than paying for two sequential round-trips
+    if debug_enabled:
+        _LOGGER.debug("Performing initial position and trip data fetch")
+    results = await asyncio.gather(
+        position_coordinator.async_config_entry_first_refresh(),
+        trip_coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
     )
+    for name, result in zip(("position", "trip"), results, strict=True):
+        # The first refresh reports failures as ConfigEntryNotReady while the
+        # entry is being set up, and as UpdateFailed otherwise
+        if isinstance(result, (ConfigEntryNotReady, UpdateFailed)):
+            # Position and trip fetch failures are not critical
+            _LOGGER.warning("Failed to fetch initial %s data", name)
+        elif isinstance(result, BaseException):
+            raise result
+        elif debug_enabled:
+            _LOGGER.debug("Initial %s data fetch successful", name)
+
+    # Iteration-only view of the coordinators
+    all_coordinators = (coordinator, position_coordinator, trip_coordinator)
+
+    _log_startup_summary(entry, coordinator, all_coordinators)
 
     # Log coordinator status
-    _LOGGER.debug("Coordinator setup complete")
-    for coord_name, coord in coordinators.items():
-        if coord:
+    if debug_enabled:
+        _LOGGER.debug("Coordinator setup complete")
+        for coord_name, coord in zip(
+            ("base", "position", "trip"), all_coordinators, strict=True
+        ):
             _LOGGER.debug(
                 "Coordinator %s: interval=%s, last_update_success=%s",
                 coord_name,
@@ -279,57 +333,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 coord.last_update_success,
             )
 
-    # Initialize auto-zero manager with storage
-    _LOGGER.debug("[AUTO-ZERO INIT] Initializing auto-zero manager")
-    auto_zero_manager = get_auto_zero_manager()
-    await auto_zero_manager.async_initialize(hass)
-    _LOGGER.debug(
-        "[AUTO-ZERO INIT] Auto-zero manager initialized, auto_zero_enabled=%s",
-        entry.options.get(CONF_AUTO_ZERO_ENABLED, False),
-    )
-
-    # Log current options for debugging
-    _LOGGER.debug(
-        "AutoPi integration options: %s",
-        entry.options,
-    )
+    if debug_enabled:
+        # Log current options for debugging
+        _LOGGER.debug(
+            "AutoPi integration options: %s",
+            entry.options,
+        )
 
     # Store coordinators
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "coordinators": coordinators,
-        # Keep these for backward compatibility
-        "coordinator": coordinator,
-        "position_coordinator": position_coordinator,
-        "trip_coordinator": trip_coordinator,
-    }
-
-    _LOGGER.debug(
-        "Successfully set up AutoPi integration with update interval: %d min",
-        entry.options.get(
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+    hass.data[DOMAIN][entry.entry_id] = AutoPiEntryData(
+        base=coordinator,
+        position=position_coordinator,
+        trip=trip_coordinator,
+        update_interval_minutes=entry.options.get(
             CONF_UPDATE_INTERVAL_FAST, DEFAULT_UPDATE_INTERVAL_FAST_MINUTES
         ),
     )
 
+    if debug_enabled:
+        _LOGGER.debug(
+            "Successfully set up AutoPi integration with update interval: %d min",
+            entry.options.get(
+                CONF_UPDATE_INTERVAL_FAST, DEFAULT_UPDATE_INTERVAL_FAST_MINUTES
+            ),
+        )
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    _LOGGER.debug(
-        "AutoPi integration setup completed successfully for entry %s", entry.entry_id
-    )
+    if debug_enabled:
+        _LOGGER.debug(
+            "AutoPi integration setup completed successfully for entry %s",
+            entry.entry_id,
+        )
 
-    # Schedule first update for all coordinators after setup is complete
-    # This ensures the update cycle continues after the initial refresh
-    for coord_name, coord in coordinators.items():
-        if coord and coord.update_interval:
-            _LOGGER.debug(
-                "Requesting refresh for %s coordinator to ensure update cycle continues",
-                coord_name,
-            )
-            await coord.async_request_refresh()
+    # No extra refresh is needed here: async_config_entry_first_refresh already
+    # schedules each coordinator's next update once the initial fetch completes.
 
     return True
 
@@ -341,46 +385,47 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
         hass: Home Assistant instance
         entry: Configuration entry with updated options
     """
-    _LOGGER.debug("Updating options for entry %s", entry.entry_id)
-
-    # Get the data
-    data = hass.data[DOMAIN][entry.entry_id]
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        _LOGGER.debug("Updating options for entry %s", entry.entry_id)
 
-    # Check if any intervals have changed
-    intervals_changed = False
+    # Auto-zero storage is only loaded at setup when the feature is enabled
+    if entry.options.get(CONF_AUTO_ZERO_ENABLED, False):
+        auto_zero_manager = get_auto_zero_manager()
+        if not auto_zero_manager.is_initialized:
+            await auto_zero_manager.async_initialize(hass)
 
-    # Check fast interval for all coordinators
+    entry_data: AutoPiEntryData = hass.data[DOMAIN][entry.entry_id]
     new_fast_interval = entry.options.get(
         CONF_UPDATE_INTERVAL_FAST, DEFAULT_UPDATE_INTERVAL_FAST_MINUTES
     )
 
-    # Check all coordinators for interval changes
-    for coord_name, coordinator in data.get("coordinators", {}).items():
-        if coordinator:
-            current_interval_minutes = (
-                coordinator.update_interval.total_seconds() / 60
-                if coordinator.update_interval
-                else DEFAULT_UPDATE_INTERVAL_FAST_MINUTES
+    # This listener also fires for unrelated option toggles. All coordinators
+    # are built with the same fast interval, so comparing against the stored
+    # value is enough to tell whether a reload is needed.
+    if new_fast_interval != entry_data.update_interval_minutes:
+        if debug_enabled:
+            _LOGGER.debug(
+                "Update interval changed from %d to %d minutes",
+                entry_data.update_interval_minutes,
+                new_fast_interval,
             )
-            if new_fast_interval != current_interval_minutes:
-                intervals_changed = True
-                _LOGGER.debug(
-                    "Update interval for %s changed from %d to %d minutes",
-                    coord_name,
-                    current_interval_minutes,
-                    new_fast_interval,
-                )
-
-    if intervals_changed:
         _LOGGER.warning(
             "Update interval change requires integration reload to take effect"
         )
         # Schedule a reload
         await hass.config_entries.async_reload(entry.entry_id)
     else:
-        # Just trigger a refresh on all coordinators
-        for coord in data.get("coordinators", {}).values():
-            await coord.async_request_refresh()
+        await _async_refresh_coordinators(
+            (entry_data.base, entry_data.position, entry_data.trip)
+        )
+
+
+async def _async_refresh_coordinators(
+    coords: tuple[AutoPiDataUpdateCoordinator, ...],
+) -> None:
+    """Request a refresh on all coordinators; they are independent."""
+    await asyncio.gather(*(coord.async_request_refresh() for coord in coords))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -393,16 +438,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         bool: True if unload successful
     """
-    _LOGGER.debug("Unloading AutoPi integration for entry %s", entry.entry_id)
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        _LOGGER.debug("Unloading AutoPi integration for entry %s", entry.entry_id)
 
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # The auto-zero manager is shared by all entries, so only reset it
+        # when the last one goes away
+        if hass.data[DOMAIN].keys() == {entry.entry_id}:
+            await get_auto_zero_manager().async_reset()
+
         # Remove coordinators
         hass.data[DOMAIN].pop(entry.entry_id)
 
-        _LOGGER.debug(
-            "Successfully unloaded AutoPi integration for entry %s", entry.entry_id
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                "Successfully unloaded AutoPi integration for entry %s", entry.entry_id
+            )
 
     return unload_ok
 
@@ -414,6 +467,7 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         hass: Home Assistant instance
         entry: Configuration entry to reload
     """
-    _LOGGER.debug("Reloading AutoPi integration for entry %s", entry.entry_id)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Reloading AutoPi integration for entry %s", entry.entry_id)
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
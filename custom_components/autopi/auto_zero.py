@@ -12,22 +12,22 @@ Key Features:
 
 Storage Format:
 The module stores zeroed metrics in JSON format at .storage/autopi_auto_zero
-with the following structure:
+as compact [vehicle_id, field_id, zeroed_at] rows:
 {
     "zeroed_metrics": [
-        {
-            "vehicle_id": "123",
-            "field_id": "obd.rpm.value",
-            "zeroed_at": "2025-07-29T10:30:00"
-        }
+        ["123", "obd.rpm.value", "2025-07-29T10:30:00+00:00"]
     ]
 }
+
+Version 1 files stored each row as an object with those three keys and are
+migrated on first load.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta, tzinfo
 from typing import Any, TypedDict
 
 from homeassistant.core import HomeAssistant
@@ -38,7 +38,7 @@ from .types import DataFieldValue
 _LOGGER = logging.getLogger(__name__)
 
 # Metrics that should be auto-zeroed when vehicle is not on a trip
-AUTO_ZERO_METRICS = {
+AUTO_ZERO_METRIC_NAMES: dict[str, str] = {
     "obd.coolant_temp.value": "Coolant Temperature (OBD)",
     "obd.engine_load.value": "Engine Load (OBD)",
     "obd.rpm.value": "Engine RPM (OBD)",
@@ -51,53 +51,137 @@ AUTO_ZERO_METRICS = {
     "std.accelerometer_axis_z.value": "Z-Axis Acceleration",
 }
 
+# Hot-path membership test; the names above are only needed for logging
+AUTO_ZERO_METRIC_IDS: frozenset[str] = frozenset(AUTO_ZERO_METRIC_NAMES)
+
 # Time threshold for considering data stale and zeroing metrics
 STALE_DATA_THRESHOLD_MINUTES = 15
+STALE_DATA_THRESHOLD = timedelta(minutes=STALE_DATA_THRESHOLD_MINUTES)
+
+# Persisted zero states older than this are not restored on load
+_LOAD_MAX_AGE = timedelta(hours=24)
 
 # Storage constants
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY = "autopi_auto_zero"
 
+# Seconds Store waits after a change before writing, so bursts share one write
+SAVE_DELAY_SECONDS = 10
 
-class ZeroedMetricData(TypedDict):
-    """Data structure for a zeroed metric."""
 
-    vehicle_id: str
-    field_id: str
-    zeroed_at: str  # ISO format timestamp
+# (vehicle_id, field_id, ISO format zeroed_at timestamp)
+ZeroedMetricRow = tuple[str, str, str]
 
 
 class AutoZeroStorageData(TypedDict):
     """Storage data structure for auto-zero state."""
 
-    zeroed_metrics: list[ZeroedMetricData]
+    zeroed_metrics: list[ZeroedMetricRow]
+
+
+class _AutoZeroStore(Store[AutoZeroStorageData]):
+    """Store that migrates older auto-zero storage formats."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> AutoZeroStorageData:
+        """Migrate version 1 keyed objects to compact rows."""
+        if old_major_version == 1:
+            return {
+                "zeroed_metrics": [
+                    (metric["vehicle_id"], metric["field_id"], metric["zeroed_at"])
+                    for metric in old_data.get("zeroed_metrics", [])
+                    if isinstance(metric, dict)
+                    and "vehicle_id" in metric
+                    and "field_id" in metric
+                    and "zeroed_at" in metric
+                ]
+            }
+        return await super()._async_migrate_func(
+            old_major_version, old_minor_version, old_data
+        )
 
 
 class AutoZeroManager:
     """Manages auto-zero state for vehicle metrics."""
 
+    __slots__ = ("_api_tz", "_dirty", "_store", "_zeroed_metrics")
+
     def __init__(self) -> None:
         """Initialize the auto-zero manager."""
-        # Track which metrics are currently zeroed
-        # Key: (vehicle_id, metric_id), Value: last_seen time when zeroed
-        self._zeroed_metrics: dict[tuple[str, str], datetime] = {}
+        # Track which metrics are currently zeroed. Membership is the
+        # observable state; the value is bookkeeping for persistence only.
+        # Nested as vehicle_id -> metric_id -> last_seen time when zeroed,
+        # so lookups hash plain strings rather than building tuple keys
+        self._zeroed_metrics: dict[str, dict[str, datetime]] = {}
 
         # Storage for persistence
-        self._hass: HomeAssistant | None = None
         self._store: Store[AutoZeroStorageData] | None = None
 
+        # Whether changes are waiting for Store's delayed write
+        self._dirty = False
+
+        # Timezone of API timestamps, captured on first evaluation
+        self._api_tz: tzinfo | None = None
+
+    @property
+    def is_initialized(self) -> bool:
+        """Return whether storage has been set up and state loaded."""
+        return self._store is not None
+
+    def _get_zeroed_at(self, vehicle_id: str, metric_id: str) -> datetime | None:
+        """Return when a metric was zeroed, or None if it is not zeroed."""
+        vehicle_metrics = self._zeroed_metrics.get(vehicle_id)
+        if vehicle_metrics is None:
+            return None
+        return vehicle_metrics.get(metric_id)
+
+    def _set_zeroed_at(
+        self, vehicle_id: str, metric_id: str, zeroed_at: datetime
+    ) -> None:
+        """Mark a metric as zeroed."""
+        self._zeroed_metrics.setdefault(vehicle_id, {})[metric_id] = zeroed_at
+
+    def _clear_zeroed(self, vehicle_id: str, metric_id: str) -> None:
+        """Remove a zeroed metric, dropping the vehicle once it has none."""
+        vehicle_metrics = self._zeroed_metrics[vehicle_id]
+        del vehicle_metrics[metric_id]
+        if not vehicle_metrics:
+            del self._zeroed_metrics[vehicle_id]
+
+    def _iter_zeroed(self) -> Iterator[tuple[str, str, datetime]]:
+        """Iterate (vehicle_id, metric_id, zeroed_at) for all zeroed metrics."""
+        for vehicle_id, vehicle_metrics in self._zeroed_metrics.items():
+            for metric_id, zeroed_at in vehicle_metrics.items():
+                yield vehicle_id, metric_id, zeroed_at
+
     async def async_initialize(self, hass: HomeAssistant) -> None:
         """Initialize storage and load persisted state.
 
         Args:
             hass: Home Assistant instance
         """
-        self._hass = hass
-        self._store = Store[AutoZeroStorageData](hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store = _AutoZeroStore(hass, STORAGE_VERSION, STORAGE_KEY)
 
         # Load persisted state
         await self._async_load()
 
+    async def async_reset(self) -> None:
+        """Flush pending changes and drop in-memory state.
+
+        The next async_initialize reloads from storage, so a reloaded
+        integration starts from the persisted state rather than leftovers.
+        """
+        await self._async_save()
+
+        self._zeroed_metrics.clear()
+        self._dirty = False
+        self._api_tz = None
+        self._store = None
+
     async def _async_load(self) -> None:
         """Load persisted zeroed metrics from storage."""
         if not self._store:
@@ -108,58 +192,55 @@ class AutoZeroManager:
             data = await self._store.async_load()
 
             if data and "zeroed_metrics" in data:
-                _LOGGER.debug(
-                    "Loading %d persisted zeroed metrics from storage",
-                    len(data["zeroed_metrics"]),
-                )
+                stored = data["zeroed_metrics"]
+                debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                if debug:
+                    _LOGGER.debug(
+                        "Loading %d persisted zeroed metrics from storage",
+                        len(stored),
+                    )
 
-                # Restore zeroed metrics
-                _LOGGER.debug(
-                    "Processing %d zeroed metrics from storage",
-                    len(data["zeroed_metrics"]),
-                )
+                # Drop malformed entries up front so the loop below only has
+                # to handle unparseable timestamps
+                valid = [
+                    row
+                    for row in stored
+                    if isinstance(row, (list, tuple)) and len(row) == 3
+                ]
+                if len(valid) != len(stored):
+                    _LOGGER.warning(
+                        "Skipped %d malformed zeroed metric entries",
+                        len(stored) - len(valid),
+                    )
 
-                for metric_data in data["zeroed_metrics"]:
+                # Only restore metrics zeroed within the last 24 hours
+                now = datetime.now(UTC)
+                for vehicle_id, field_id, zeroed_at_iso in valid:
                     try:
-                        vehicle_id = metric_data["vehicle_id"]
-                        field_id = metric_data["field_id"]
-                        zeroed_at = datetime.fromisoformat(metric_data["zeroed_at"])
+                        zeroed_at = datetime.fromisoformat(zeroed_at_iso)
+                    except (TypeError, ValueError) as e:
+                        _LOGGER.warning(
+                            "Failed to restore zeroed metric: %s",
+                            str(e),
+                        )
+                        continue
+                    if zeroed_at.tzinfo is None:
+                        # Older storage may hold naive timestamps
+                        zeroed_at = zeroed_at.replace(tzinfo=UTC)
 
-                        metric_key = (vehicle_id, field_id)
-                        # Only restore if the metric should still be zeroed
-                        # (i.e., it was zeroed within the last 24 hours)
-                        now = datetime.now(zeroed_at.tzinfo or UTC)
-                        age_hours = (now - zeroed_at).total_seconds() / 3600
+                    age = now - zeroed_at
+                    restore = age < _LOAD_MAX_AGE
+                    if restore:
+                        self._set_zeroed_at(vehicle_id, field_id, zeroed_at)
 
+                    if debug:
                         _LOGGER.debug(
-                            "Evaluating stored zero state: %s on vehicle %s, zeroed %.1f hours ago",
-                            AUTO_ZERO_METRICS.get(field_id, field_id),
+                            "%s zeroed state for %s on vehicle %s (zeroed %.1f hours ago at %s)",
+                            "RESTORED" if restore else "SKIPPED (too old)",
+                            AUTO_ZERO_METRIC_NAMES.get(field_id, field_id),
                             vehicle_id,
-                            age_hours,
-                        )
-
-                        if now - zeroed_at < timedelta(hours=24):
-                            self._zeroed_metrics[metric_key] = zeroed_at
-
-                            _LOGGER.debug(
-                                "RESTORED zeroed state for %s on vehicle %s (zeroed %.1f hours ago at %s)",
-                                AUTO_ZERO_METRICS.get(field_id, field_id),
-                                vehicle_id,
-                                age_hours,
-                                zeroed_at.isoformat(),
-                            )
-                        else:
-                            _LOGGER.debug(
-                                "SKIPPED restoring zeroed state for %s on vehicle %s - too old (%.1f hours, zeroed at %s)",
-                                AUTO_ZERO_METRICS.get(field_id, field_id),
-                                vehicle_id,
-                                age_hours,
-                                zeroed_at.isoformat(),
-                            )
-                    except (KeyError, ValueError) as e:
-                        _LOGGER.warning(
-                            "Failed to restore zeroed metric: %s",
-                            str(e),
+                            age.total_seconds() / 3600,
+                            zeroed_at.isoformat(),
                         )
             else:
                 _LOGGER.debug("No persisted zeroed metrics found")
@@ -171,42 +252,50 @@ class AutoZeroManager:
             )
             # Continue with empty state - don't crash on storage errors
 
-    async def _async_save(self) -> None:
-        """Save current zeroed metrics to storage."""
-        if not self._store:
-            _LOGGER.debug("No storage available, skipping save")
-            return
-
-        try:
-            # Convert zeroed metrics to storage format
-            zeroed_metrics: list[ZeroedMetricData] = []
-
-            for (vehicle_id, field_id), zeroed_at in self._zeroed_metrics.items():
-                zeroed_metrics.append(
-                    {
-                        "vehicle_id": vehicle_id,
-                        "field_id": field_id,
-                        "zeroed_at": zeroed_at.isoformat(),
-                    }
-                )
+    def _build_storage_data(self) -> AutoZeroStorageData:
+        """Build the storage payload from the current zeroed metrics.
 
-            data: AutoZeroStorageData = {"zeroed_metrics": zeroed_metrics}
+        Store calls this when its delayed write fires, so the payload always
+        reflects the latest state.
+        """
+        self._dirty = False
 
-            await self._store.async_save(data)
+        # Convert zeroed metrics to compact storage rows
+        zeroed_metrics: list[ZeroedMetricRow] = [
+            (vehicle_id, field_id, zeroed_at.isoformat())
+            for vehicle_id, field_id, zeroed_at in self._iter_zeroed()
+        ]
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "[AUTO-ZERO SAVE] Saved %d zeroed metrics to storage",
+                "[AUTO-ZERO SAVE] Writing %d zeroed metrics to storage",
                 len(zeroed_metrics),
             )
-            for metric in zeroed_metrics:
+            for vehicle_id, field_id, zeroed_at_iso in zeroed_metrics:
                 _LOGGER.debug(
                     "[AUTO-ZERO SAVE] Saved: %s on vehicle %s (zeroed at %s)",
-                    AUTO_ZERO_METRICS.get(metric["field_id"], metric["field_id"]),
-                    metric["vehicle_id"],
-                    metric["zeroed_at"],
+                    AUTO_ZERO_METRIC_NAMES.get(field_id, field_id),
+                    vehicle_id,
+                    zeroed_at_iso,
                 )
 
+        return {"zeroed_metrics": zeroed_metrics}
+
+    async def _async_save(self) -> None:
+        """Write pending changes now instead of waiting for the delayed write."""
+        if not self._store:
+            _LOGGER.debug("No storage available, skipping save")
+            return
+
+        if not self._dirty:
+            _LOGGER.debug("[AUTO-ZERO SAVE] No changes since last save, skipping")
+            return
+
+        try:
+            # Replaces any delayed write Store still has pending
+            await self._store.async_save(self._build_storage_data())
         except Exception as e:
+            self._dirty = True
             _LOGGER.error(
                 "Failed to save auto-zero state to storage: %s",
                 str(e),
@@ -214,18 +303,18 @@ class AutoZeroManager:
             )
 
     def _schedule_save(self) -> None:
-        """Schedule a save operation to persist state."""
-        if self._hass:
-            _LOGGER.debug(
-                "[AUTO-ZERO SAVE] Scheduling save operation with %d zeroed metrics",
-                len(self._zeroed_metrics),
-            )
-            # Use Home Assistant's async_create_task to schedule the save
-            self._hass.async_create_task(self._async_save())
-        else:
+        """Mark state as changed and schedule a coalesced save."""
+        self._dirty = True
+
+        if not self._store:
             _LOGGER.debug(
-                "[AUTO-ZERO SAVE] No Home Assistant instance available, cannot schedule save"
+                "[AUTO-ZERO SAVE] Storage not initialized, cannot schedule save"
             )
+            return
+
+        # Store coalesces repeated calls into a single write and flushes any
+        # pending write when Home Assistant shuts down
+        self._store.async_delay_save(self._build_storage_data, SAVE_DELAY_SECONDS)
 
     def should_zero_metric(
         self,
@@ -236,6 +325,8 @@ class AutoZeroManager:
     ) -> bool:
         """Determine if a metric should be zeroed.
 
+        Single-metric form of evaluate_batch, which holds the state machine.
+
         Args:
             vehicle_id: Vehicle ID
             metric_id: Metric field ID
@@ -245,125 +336,85 @@ class AutoZeroManager:
         Returns:
             True if the metric should be zeroed, False otherwise
         """
-        try:
-            metric_name = AUTO_ZERO_METRICS.get(metric_id, metric_id)
-
-            # Feature must be enabled
-            if not auto_zero_enabled:
-                return False
-
-            # Only auto-zero specific metrics
-            if metric_id not in AUTO_ZERO_METRICS:
-                return False
-
-            # If no field data, can't make a decision
-            if field_data is None:
-                _LOGGER.debug(
-                    "No field data available for %s on vehicle %s",
-                    metric_name,
-                    vehicle_id,
-                )
-                return False
-
-            metric_key = (vehicle_id, metric_id)
-            # Use timezone-aware datetime to match field_data.last_seen
-            now = datetime.now(field_data.last_seen.tzinfo)
+        if (
+            not auto_zero_enabled
+            or metric_id not in AUTO_ZERO_METRIC_IDS
+            or field_data is None
+        ):
+            return False
 
-            _LOGGER.debug(
-                "[AUTO-ZERO] Processing %s for vehicle %s - last_seen: %s, age: %.1f minutes",
-                metric_name,
-                vehicle_id,
-                field_data.last_seen.isoformat(),
-                (now - field_data.last_seen).total_seconds() / 60,
-            )
+        self.evaluate_batch(((vehicle_id, metric_id, field_data),), True)
+        return self._get_zeroed_at(vehicle_id, metric_id) is not None
 
-            # Calculate time since last update
-            time_since_update = now - field_data.last_seen
-            was_zeroed = metric_key in self._zeroed_metrics
+    def evaluate_batch(
+        self,
+        updates: Iterable[tuple[str, str, DataFieldValue | None]],
+        auto_zero_enabled: bool,
+    ) -> None:
+        """Update the zeroed state of many metrics at once.
 
-            _LOGGER.debug(
-                "[AUTO-ZERO EVAL] %s on vehicle %s: last_seen %.1f min ago (threshold %d min), currently zeroed: %s",
-                metric_name,
-                vehicle_id,
-                time_since_update.total_seconds() / 60,
-                STALE_DATA_THRESHOLD_MINUTES,
-                was_zeroed,
-            )
+        Stale tracked metrics are zeroed and fresh ones un-zeroed. The clock
+        is read once and at most one save is scheduled for the whole batch.
+        Read the outcome with is_metric_zeroed.
 
-            # Check if data is stale (greater than threshold)
-            if time_since_update > timedelta(minutes=STALE_DATA_THRESHOLD_MINUTES):
-                if not was_zeroed:
-                    _LOGGER.debug(
-                        "[AUTO-ZERO ACTION] ZEROING %s for vehicle %s - data is %.1f minutes old (threshold: %d min)",
-                        metric_name,
-                        vehicle_id,
-                        time_since_update.total_seconds() / 60,
-                        STALE_DATA_THRESHOLD_MINUTES,
-                    )
-                    self._zeroed_metrics[metric_key] = field_data.last_seen
-                    # Schedule save
-                    self._schedule_save()
-                    _LOGGER.debug(
-                        "[AUTO-ZERO] Scheduled save after zeroing %s",
-                        metric_name,
-                    )
-                else:
-                    # Update the stored last_seen time if it's changed
-                    stored_last_seen = self._zeroed_metrics.get(metric_key)
-                    if stored_last_seen != field_data.last_seen:
-                        _LOGGER.debug(
-                            "[AUTO-ZERO UPDATE] Updating stored last_seen for already-zeroed %s on vehicle %s (old: %s, new: %s)",
-                            metric_name,
-                            vehicle_id,
-                            stored_last_seen.isoformat()
-                            if stored_last_seen
-                            else "None",
-                            field_data.last_seen.isoformat(),
-                        )
-                        self._zeroed_metrics[metric_key] = field_data.last_seen
-                        # Schedule save
-                        self._schedule_save()
-                    else:
-                        _LOGGER.debug(
-                            "[AUTO-ZERO] %s already zeroed, no update needed",
-                            metric_name,
-                        )
-                return True
-            else:
-                # Data is fresh - remove from zeroed metrics if it was zeroed
-                if was_zeroed:
-                    _LOGGER.debug(
-                        "[AUTO-ZERO ACTION] UN-ZEROING %s for vehicle %s - fresh data received (%.1f minutes old)",
-                        metric_name,
-                        vehicle_id,
-                        time_since_update.total_seconds() / 60,
-                    )
-                    del self._zeroed_metrics[metric_key]
-                    # Schedule save
-                    self._schedule_save()
-                    _LOGGER.debug(
-                        "[AUTO-ZERO] Scheduled save after un-zeroing %s",
-                        metric_name,
-                    )
-                else:
-                    _LOGGER.debug(
-                        "[AUTO-ZERO] %s on vehicle %s has fresh data (%.1f min old), not zeroed",
-                        metric_name,
-                        vehicle_id,
-                        time_since_update.total_seconds() / 60,
-                    )
-                return False
+        Args:
+            updates: (vehicle_id, metric_id, field_data) tuples to evaluate
+            auto_zero_enabled: Whether auto-zero is enabled
+        """
+        if not auto_zero_enabled:
+            return
 
-        except Exception as e:
-            _LOGGER.error(
-                "Error evaluating auto-zero for %s on vehicle %s: %s",
-                metric_id,
-                vehicle_id,
-                str(e),
-                exc_info=True,
-            )
-            # On error, fail safe - don't zero
-            return False
+        zeroed = self._zeroed_metrics
+        metric_ids = AUTO_ZERO_METRIC_IDS
+        threshold = STALE_DATA_THRESHOLD
+        now: datetime | None = None
+        evaluated = 0
+        changed = 0
+
+        for vehicle_id, metric_id, field_data in updates:
+            if metric_id not in metric_ids or field_data is None:
+                continue
+
+            last_seen = field_data.last_seen
+            if now is None:
+                if self._api_tz is None:
+                    self._api_tz = last_seen.tzinfo
+                now = datetime.now(self._api_tz)
+
+            # A naive/aware mix is the only way this can fail, so fail safe
+            # for this metric without a traceback per tick
+            try:
+                is_stale = now - last_seen > threshold
+            except (TypeError, ValueError) as e:
+                _LOGGER.error(
+                    "Error evaluating auto-zero for %s on vehicle %s: %s",
+                    metric_id,
+                    vehicle_id,
+                    str(e),
+                )
+                continue
+
+            evaluated += 1
+            vehicle_metrics = zeroed.get(vehicle_id)
+            if is_stale:
+                if vehicle_metrics is None:
+                    vehicle_metrics = zeroed[vehicle_id] = {}
+                if metric_id not in vehicle_metrics:
+                    changed += 1
+                # A last_seen refresh alone is saved with the next change
+                vehicle_metrics[metric_id] = last_seen
+            elif vehicle_metrics is not None and metric_id in vehicle_metrics:
+                self._clear_zeroed(vehicle_id, metric_id)
+                changed += 1
+
+        if changed:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[AUTO-ZERO BATCH] Evaluated %d metrics, %d state changes",
+                    evaluated,
+                    changed,
+                )
+            self._schedule_save()
 
     def cleanup_old_data(self, keep_hours: int = 24) -> None:
         """Clean up old zeroed metrics to prevent memory growth.
@@ -374,21 +425,27 @@ class AutoZeroManager:
         try:
             # Use UTC for internal timestamps
             now = datetime.now(UTC)
-
-            # Remove old zeroed metrics that haven't been updated recently
-            old_metrics = [
-                key
-                for key, time in self._zeroed_metrics.items()
-                if now - time > timedelta(hours=keep_hours)
-            ]
-
-            for key in old_metrics:
-                del self._zeroed_metrics[key]
-
-            if old_metrics:
+            threshold = timedelta(hours=keep_hours)
+
+            # Keep only zeroed metrics that have been updated recently
+            before = 0
+            kept: dict[str, dict[str, datetime]] = {}
+            for vehicle_id, vehicle_metrics in self._zeroed_metrics.items():
+                before += len(vehicle_metrics)
+                recent = {
+                    metric_id: time
+                    for metric_id, time in vehicle_metrics.items()
+                    if now - time <= threshold
+                }
+                if recent:
+                    kept[vehicle_id] = recent
+            removed = before - sum(map(len, kept.values()))
+
+            if removed:
+                self._zeroed_metrics = kept
                 _LOGGER.debug(
                     "Cleanup complete: removed %d old zeroed metrics",
-                    len(old_metrics),
+                    removed,
                 )
 
         except Exception as e:
@@ -408,28 +465,30 @@ class AutoZeroManager:
         Returns:
             True if the metric is currently zeroed, False otherwise
         """
-        metric_key = (vehicle_id, metric_id)
-        is_zeroed = metric_key in self._zeroed_metrics
-
-        if is_zeroed:
-            zeroed_at = self._zeroed_metrics[metric_key]
-            age_minutes = (
-                datetime.now(zeroed_at.tzinfo or UTC) - zeroed_at
-            ).total_seconds() / 60
+        zeroed_at = self._get_zeroed_at(vehicle_id, metric_id)
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return zeroed_at is not None
+
+        metric_name = AUTO_ZERO_METRIC_NAMES.get(metric_id, metric_id)
+        if zeroed_at is not None:
+            if zeroed_at.tzinfo is None:
+                # API timestamps may be naive; treat them as UTC like on load
+                zeroed_at = zeroed_at.replace(tzinfo=UTC)
+            age_minutes = (datetime.now(UTC) - zeroed_at).total_seconds() / 60
             _LOGGER.debug(
                 "is_metric_zeroed check: %s on vehicle %s IS ZEROED (zeroed %.1f minutes ago)",
-                AUTO_ZERO_METRICS.get(metric_id, metric_id),
+                metric_name,
                 vehicle_id,
                 age_minutes,
             )
         else:
             _LOGGER.debug(
                 "is_metric_zeroed check: %s on vehicle %s NOT ZEROED",
-                AUTO_ZERO_METRICS.get(metric_id, metric_id),
+                metric_name,
                 vehicle_id,
             )
 
-        return is_zeroed
+        return zeroed_at is not None
 
     def get_metric_status(self, vehicle_id: str, metric_id: str) -> dict[str, Any]:
         """Get the current status of a metric for entity attributes.
@@ -441,28 +500,26 @@ class AutoZeroManager:
         Returns:
             Dictionary with metric status information
         """
-        metric_key = (vehicle_id, metric_id)
+        zeroed_at = self._get_zeroed_at(vehicle_id, metric_id)
 
         status: dict[str, Any] = {
-            "auto_zero_enabled": metric_id in AUTO_ZERO_METRICS,
-            "is_zeroed": metric_key in self._zeroed_metrics,
+            "auto_zero_enabled": metric_id in AUTO_ZERO_METRIC_IDS,
+            "is_zeroed": zeroed_at is not None,
         }
 
-        if metric_key in self._zeroed_metrics:
-            status["zeroed_at"] = self._zeroed_metrics[metric_key].isoformat()
+        if zeroed_at is not None:
+            status["zeroed_at"] = zeroed_at.isoformat()
 
         # No more cooldown tracking
 
         return status
 
 
-# Global instance
-_auto_zero_manager: AutoZeroManager | None = None
+# Global instance; construction needs no hass, storage is set up later by
+# async_initialize
+_auto_zero_manager = AutoZeroManager()
 
 
 def get_auto_zero_manager() -> AutoZeroManager:
     """Get the global auto-zero manager instance."""
-    global _auto_zero_manager
-    if _auto_zero_manager is None:
-        _auto_zero_manager = AutoZeroManager()
     return _auto_zero_manager
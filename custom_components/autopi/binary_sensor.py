@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DATA_FIELD_TIMEOUT_MINUTES, DOMAIN
@@ -23,8 +23,33 @@ from .coordinator import (
 from .entities.base import AutoPiVehicleEntity
 from .types import DataFieldValue
 
+if TYPE_CHECKING:
+    from . import AutoPiEntryData
+
 _LOGGER = logging.getLogger(__name__)
 
+# How long a cached data field value keeps the entity available
+_DATA_FIELD_TIMEOUT = timedelta(minutes=DATA_FIELD_TIMEOUT_MINUTES)
+
+# Normalized string readings mapped to the binary state they represent
+_CHARGING_STATES: dict[str, bool] = {
+    "charging": True,
+    "fast_charging": True,
+    "slow_charging": True,
+    "discharging": False,
+    "idle": False,
+    "not_charging": False,
+    "unknown": False,
+}
+_IGNITION_STATES: dict[str, bool] = {
+    "on": True,
+    "true": True,
+    "running": True,
+    "off": False,
+    "false": False,
+    "stopped": False,
+}
+
 
 class AutoPiDataFieldBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
     """Base class for data field derived binary sensors."""
@@ -48,16 +73,45 @@ class AutoPiDataFieldBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
         self._attr_icon = icon
         self._last_known_value: bool | None = None
         self._last_update_time: datetime | None = None
+        # Last (raw string, parsed state) pair; readings rarely change
+        # between polls, so this skips re-normalizing the same string
+        self._last_parse: tuple[str, bool | None] | None = None
+        # Field data for the current coordinator update; is_on, available and
+        # extra_state_attributes all read it during one state write
+        self._field_data: DataFieldValue | None = None
+        self._field_data_valid = False
+        # Whether the last known value may stand in for missing field data;
+        # decided once per coordinator update rather than on every read
+        self._last_known_fresh = False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached field data before writing the new state."""
+        self._field_data_valid = False
+        self._last_known_fresh = (
+            self._last_known_value is not None
+            and self._last_update_time is not None
+            and datetime.now(UTC) - self._last_update_time < _DATA_FIELD_TIMEOUT
+        )
+        super()._handle_coordinator_update()
 
     def _get_field_data(self) -> DataFieldValue | None:
         """Return data field value."""
-        if (
-            not self.vehicle
-            or not hasattr(self.vehicle, "data_fields")
-            or self.vehicle.data_fields is None
-        ):
-            return None
-        return self.vehicle.data_fields.get(self._field_id)
+        if not self._field_data_valid:
+            vehicle = self.vehicle
+            data_fields = getattr(vehicle, "data_fields", None) if vehicle else None
+            self._field_data = data_fields.get(self._field_id) if data_fields else None
+            self._field_data_valid = True
+        return self._field_data
+
+    def _parse_state(self, value: str, states: dict[str, bool]) -> bool | None:
+        """Map a string reading to a state, or None if it is unrecognized."""
+        last_parse = self._last_parse
+        if last_parse is not None and last_parse[0] == value:
+            return last_parse[1]
+        state = states.get(value.strip().lower())
+        self._last_parse = (value, state)
+        return state
 
     def _cache_value(self, value: bool, field_data: DataFieldValue) -> bool:
         """Cache value and update timestamps."""
@@ -71,16 +125,7 @@ class AutoPiDataFieldBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
         if not super().available:
             return False
 
-        field_data = self._get_field_data()
-        if field_data is not None:
-            return True
-
-        if self._last_known_value is not None and self._last_update_time is not None:
-            return datetime.now(UTC) - self._last_update_time < timedelta(
-                minutes=DATA_FIELD_TIMEOUT_MINUTES
-            )
-
-        return False
+        return self._get_field_data() is not None or self._last_known_fresh
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -118,12 +163,10 @@ class BatteryChargingStateBinarySensor(AutoPiDataFieldBinarySensor):
 
         value = field_data.last_value
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"charging", "fast_charging", "slow_charging"}:
-                return self._cache_value(True, field_data)
-            if normalized in {"discharging", "idle", "not_charging", "unknown"}:
-                return self._cache_value(False, field_data)
-            return None
+            state = self._parse_state(value, _CHARGING_STATES)
+            if state is None:
+                return None
+            return self._cache_value(state, field_data)
 
         if isinstance(value, (int, float)):
             return self._cache_value(value > 0, field_data)
@@ -163,11 +206,9 @@ class IgnitionRunningBinarySensor(AutoPiDataFieldBinarySensor):
         if isinstance(value, bool):
             return self._cache_value(value, field_data)
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"on", "true", "running"}:
-                return self._cache_value(True, field_data)
-            if normalized in {"off", "false", "stopped"}:
-                return self._cache_value(False, field_data)
+            state = self._parse_state(value, _IGNITION_STATES)
+            if state is not None:
+                return self._cache_value(state, field_data)
         return None
 
 
@@ -240,6 +281,20 @@ class TrackerOnlineBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
         super().__init__(coordinator, vehicle_id, "tracker_online")
         self._attr_name = "Tracker Online"
         self._attr_icon = "mdi:access-point"
+        # Filled on first use, then kept until the next coordinator update
+        self._online_threshold: timedelta | None = None
+
+    def _get_online_threshold(self) -> timedelta:
+        """Return the online threshold, which only follows the update interval."""
+        if self._online_threshold is None:
+            self._online_threshold = self.coordinator.get_online_threshold()
+        return self._online_threshold
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached threshold before writing the new state."""
+        self._online_threshold = None
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
@@ -247,8 +302,7 @@ class TrackerOnlineBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
         last_comm = self.coordinator.get_last_communication(self._vehicle_id)
         if last_comm is None:
             return None
-        threshold = self.coordinator.get_online_threshold()
-        return datetime.now(UTC) - last_comm <= threshold
+        return datetime.now(UTC) - last_comm <= self._get_online_threshold()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -261,7 +315,7 @@ class TrackerOnlineBinarySensor(AutoPiVehicleEntity, BinarySensorEntity):
                 (datetime.now(UTC) - last_comm).total_seconds()
             )
         attrs["online_threshold_seconds"] = int(
-            self.coordinator.get_online_threshold().total_seconds()
+            self._get_online_threshold().total_seconds()
         )
         return attrs
 
@@ -272,20 +326,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up AutoPi binary sensors from a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    coordinator: AutoPiDataUpdateCoordinator = data["coordinator"]
-    position_coordinator: AutoPiDataUpdateCoordinator = data["position_coordinator"]
+    data: AutoPiEntryData = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: AutoPiDataUpdateCoordinator = data.base
+    position_coordinator: AutoPiDataUpdateCoordinator = data.position
 
     entities: list[BinarySensorEntity] = []
 
-    vehicle_ids = set(coordinator.data or {})
+    # Per-entry lookups hoisted out of the vehicle loop
+    position_data = position_coordinator.data or {}
+    tracker_supported = position_coordinator.is_endpoint_supported(
+        ENDPOINT_KEY_MOST_RECENT_POSITIONS
+    )
 
-    for vehicle_id in vehicle_ids:
+    for vehicle_id in coordinator.data or {}:
         # Movement and online sensors use position coordinator data
         entities.append(MovementBinarySensor(position_coordinator, vehicle_id))
-        if position_coordinator.is_endpoint_supported(
-            ENDPOINT_KEY_MOST_RECENT_POSITIONS
-        ):
+        if tracker_supported:
             entities.append(TrackerOnlineBinarySensor(position_coordinator, vehicle_id))
 
         # Charging state sensors use base coordinator data
@@ -295,19 +351,13 @@ async def async_setup_entry(
             entities.append(ChargingInProgressBinarySensor(coordinator, vehicle_id))
 
         # Data field derived binary sensors
-        vehicle_data = (
-            position_coordinator.data.get(vehicle_id)
-            if position_coordinator.data
-            else None
-        )
-        if vehicle_data and vehicle_data.data_fields:
-            available_fields = set(vehicle_data.data_fields.keys())
-
-            if "obd.bat.state" in available_fields:
+        vehicle_data = position_data.get(vehicle_id)
+        if vehicle_data and (data_fields := vehicle_data.data_fields):
+            if "obd.bat.state" in data_fields:
                 entities.append(
                     BatteryChargingStateBinarySensor(position_coordinator, vehicle_id)
                 )
-            if "std.ignition.value" in available_fields:
+            if "std.ignition.value" in data_fields:
                 entities.append(
                     IgnitionRunningBinarySensor(position_coordinator, vehicle_id)
                 )
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any, Final, cast
 
 from aiohttp import ClientError, ClientSession, ClientTimeout
+from homeassistant.util.json import json_loads
+from multidict import CIMultiDict, CIMultiDictProxy
 
 from .const import (
     ALERTS_ENDPOINT,
@@ -62,6 +69,71 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT: Final = 30
 MAX_RETRIES: Final = 3
 RETRY_DELAY: Final = 1  # seconds
+MAX_BACKOFF: Final = 30  # seconds
+RETRY_JITTER: Final = 0.25  # seconds
+MAX_CONCURRENT_REQUESTS: Final = 10
+
+# Base sleep before each retry, doubling from RETRY_DELAY up to MAX_BACKOFF
+_RETRY_DELAYS: Final = tuple(
+    min(MAX_BACKOFF, RETRY_DELAY * 2**retry) for retry in range(MAX_RETRIES)
+)
+
+# Shared by every request; ClientTimeout is immutable
+_CLIENT_TIMEOUT: Final = ClientTimeout(total=DEFAULT_TIMEOUT)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Return the seconds a Retry-After header asks to wait, if it is valid.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value cannot be parsed
+    """
+    try:
+        return int(value)
+    except TypeError, ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return (retry_at - datetime.now(UTC)).total_seconds()
+
+
+def _retry_delay(retry: int, retry_after: str | None = None) -> float:
+    """Return the seconds to wait before a retry.
+
+    A valid Retry-After header takes precedence. Otherwise the delay backs
+    off exponentially with random jitter so that clients hit by the same
+    outage do not retry in lockstep.
+
+    Args:
+        retry: Zero-based index of the retry about to be made
+        retry_after: Retry-After header value from the failed response
+
+    Returns:
+        Delay in seconds. Only a Retry-After delay can exceed MAX_BACKOFF,
+        in which case callers should give up rather than wait.
+    """
+    if retry_after and (delay := _parse_retry_after(retry_after)) is not None:
+        return max(delay, 0.0)
+
+    # Jitter only spreads retries out; it needs no cryptographic randomness
+    jitter = random.uniform(0, RETRY_JITTER)  # noqa: S311  # nosec B311
+    return min(_RETRY_DELAYS[retry] + jitter, MAX_BACKOFF)
+
+
+@dataclass(slots=True)
+class _APIResponse:
+    """Status, decoded body and headers of an API response."""
+
+    status: int
+    data: Any
+    headers: Mapping[str, str]
 
 
 class AutoPiClient:
@@ -72,23 +144,45 @@ class AutoPiClient:
         session: ClientSession,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the AutoPi client.
 
+        The client does not own its session. Pass Home Assistant's shared
+        session from async_get_clientsession; its connector already pools
+        keep-alive connections, caches DNS lookups and bounds connections per
+        host, so polls reuse warm TLS connections to the API.
+
         Args:
             session: aiohttp client session
             api_key: AutoPi API key
             base_url: Base URL for AutoPi API
+            max_concurrent_requests: Most requests this client has in flight
         """
         self._session = session
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
-        self._headers = {
-            "Authorization": f"APIToken {api_key}",
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        # Built once as a read-only CIMultiDict, which aiohttp merges without
+        # first converting it as it would a plain dict. Content-Type is left
+        # out: aiohttp sets it when a request actually sends a JSON body
+        self._headers: CIMultiDictProxy[str] = CIMultiDictProxy(
+            CIMultiDict(
+                {
+                    "Authorization": f"APIToken {api_key}",
+                    "User-Agent": USER_AGENT,
+                    "Accept": "application/json",
+                }
+            )
+        )
+
+        # Bounds in-flight requests if callers fan out; retries release their
+        # slot while backing off
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        # Conditional request headers and the vehicles parsed from the last
+        # full vehicle profile response, reused when the server answers 304
+        self._vehicles_validators: dict[str, str] = {}
+        self._cached_vehicles: list[AutoPiVehicle] = []
 
         _LOGGER.debug("AutoPi client initialized with base URL: %s", self._base_url)
 
@@ -106,12 +200,21 @@ class AutoPiClient:
         _LOGGER.debug("Fetching vehicles from AutoPi API")
 
         try:
-            data = await self._request(
+            response = await self._request_response(
                 "GET",
                 VEHICLE_PROFILE_ENDPOINT,
+                headers=self._vehicles_validators,
             )
 
+            if response.status == 304:
+                _LOGGER.debug(
+                    "Vehicle profiles not modified, reusing %d cached vehicles",
+                    len(self._cached_vehicles),
+                )
+                return list(self._cached_vehicles)
+
             # Type-safe access to response data
+            data = response.data
             vehicle_count = data.get("count", 0)
             results = data.get("results", [])
 
@@ -121,11 +224,18 @@ class AutoPiClient:
             )
 
             # Convert API data to AutoPiVehicle objects
-            vehicles = [
-                AutoPiVehicle.from_api_data(vehicle_data) for vehicle_data in results
-            ]
+            vehicles = list(map(AutoPiVehicle.from_api_data, results))
+
+            # Remember validators so the next poll can skip an unchanged body
+            validators: dict[str, str] = {}
+            if etag := response.headers.get("ETag"):
+                validators["If-None-Match"] = etag
+            if last_modified := response.headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = last_modified
+            self._vehicles_validators = validators
+            self._cached_vehicles = vehicles
 
-            return vehicles
+            return list(vehicles)
 
         except Exception:
             _LOGGER.exception("Failed to fetch vehicles")
@@ -165,6 +275,7 @@ class AutoPiClient:
                 return {}
 
             fields: dict[str, DataFieldValue] = {}
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
             for field_data in response:
                 try:
@@ -172,12 +283,13 @@ class AutoPiClient:
                     field_value = DataFieldValue.from_api_data(field_response)
                     fields[field_value.field_id] = field_value
 
-                    _LOGGER.debug(
-                        "Parsed field %s: %s = %s",
-                        field_value.field_id,
-                        field_value.title,
-                        field_value.last_value,
-                    )
+                    if debug:
+                        _LOGGER.debug(
+                            "Parsed field %s: %s = %s",
+                            field_value.field_id,
+                            field_value.title,
+                            field_value.last_value,
+                        )
 
                 except (KeyError, TypeError) as err:
                     _LOGGER.warning("Failed to parse field data: %s", err)
@@ -734,7 +846,6 @@ class AutoPiClient:
         endpoint: str,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-        retry_count: int = 0,
     ) -> dict[str, Any]:
         """Make a request to the AutoPi API.
 
@@ -743,7 +854,6 @@ class AutoPiClient:
             endpoint: API endpoint
             data: Request data
             params: Query parameters
-            retry_count: Current retry count
 
         Returns:
             Response data
@@ -753,129 +863,217 @@ class AutoPiClient:
             AutoPiConnectionError: If connection fails
             AutoPiAPIError: If API returns an error
         """
+        response = await self._request_response(method, endpoint, data, params)
+        return cast(dict[str, Any], response.data)
+
+    async def _request_response(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> _APIResponse:
+        """Make a request to the AutoPi API and return the full response.
+
+        Rate limited (429), server and connection errors are retried up to
+        MAX_RETRIES times, honoring Retry-After when the server sends one.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request data
+            params: Query parameters
+            headers: Extra request headers, such as conditional request headers
+
+        Returns:
+            Response status, data and headers; data is None for 304 responses
+
+        Raises:
+            AutoPiAuthenticationError: If authentication fails
+            AutoPiConnectionError: If connection fails
+            AutoPiRateLimitError: If rate limiting persists, or a 429's
+                Retry-After asks to wait longer than MAX_BACKOFF
+            AutoPiAPIError: If API returns an error
+        """
         url = f"{self._base_url}{endpoint}"
+        request_headers: CIMultiDictProxy[str] | CIMultiDict[str] = self._headers
+        if headers:
+            request_headers = CIMultiDict(self._headers)
+            request_headers.update(headers)
 
-        _LOGGER.debug(
-            "Making %s request to %s (retry %d/%d)",
-            method,
-            endpoint,  # Log endpoint without base URL to avoid exposing full URLs
-            retry_count,
-            MAX_RETRIES,
-        )
+        # Every API call passes through here; skip building debug arguments
+        # unless they will be emitted
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        if params:
+        if debug and params:
             # Log params but filter out any sensitive data
             safe_params = {
                 k: v for k, v in params.items() if k not in ["api_key", "token"]
             }
             _LOGGER.debug("Request params: %s", safe_params)
 
-        try:
-            async with self._session.request(
-                method,
-                url,
-                headers=self._headers,
-                json=data,
-                params=params,
-                timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
-            ) as response:
-                response_text = await response.text()
+        attempt = 0
+        delay = 0.0
+        while True:
+            if attempt:
+                await asyncio.sleep(delay)
 
+            if debug:
                 _LOGGER.debug(
-                    "Received response with status %d for %s %s",
-                    response.status,
+                    "Making %s request to %s (retry %d/%d)",
                     method,
-                    url,
+                    endpoint,  # Log endpoint without base URL to avoid exposing full URLs
+                    attempt,
+                    MAX_RETRIES,
                 )
 
-                if response.status == 401:
-                    _LOGGER.error("Authentication failed: Invalid API key")
-                    raise AutoPiAuthenticationError("Invalid API key")
-
-                if response.status == 429:
-                    _LOGGER.warning("Rate limit exceeded")
-                    raise AutoPiRateLimitError(
-                        "Rate limit exceeded", status_code=response.status
-                    )
-
-                if response.status >= 500:
-                    _LOGGER.error("Server error %d: %s", response.status, response_text)
-
-                    # Retry on server errors
-                    if retry_count < MAX_RETRIES:
+            try:
+                async with (
+                    self._request_semaphore,
+                    self._session.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        json=data,
+                        params=params,
+                        timeout=_CLIENT_TIMEOUT,
+                    ) as response,
+                ):
+                    if debug:
                         _LOGGER.debug(
-                            "Retrying request after server error (attempt %d/%d)",
-                            retry_count + 1,
-                            MAX_RETRIES,
+                            "Received response with status %d for %s %s",
+                            response.status,
+                            method,
+                            url,
                         )
-                        await asyncio.sleep(RETRY_DELAY * (retry_count + 1))
-                        return await self._request(
-                            method, endpoint, data, params, retry_count + 1
-                        )
-
-                    raise AutoPiAPIError(
-                        f"Server error: {response.status}",
-                        status_code=response.status,
-                        data={"response": response_text},
-                    )
 
-                if response.status >= 400:
-                    if response.status == 404:
-                        _LOGGER.debug(
-                            "Resource not found (%s): %s", endpoint, response_text
+                    if response.status == 401:
+                        _LOGGER.error("Authentication failed: Invalid API key")
+                        raise AutoPiAuthenticationError("Invalid API key")
+
+                    if response.status == 429:
+                        # Retry transient rate limiting, waiting as long as
+                        # the server asks when it says
+                        if attempt < MAX_RETRIES:
+                            delay = _retry_delay(
+                                attempt, response.headers.get("Retry-After")
+                            )
+                            # A longer wait would stall the update; give up
+                            if delay <= MAX_BACKOFF:
+                                attempt += 1
+                                if debug:
+                                    _LOGGER.debug(
+                                        "Rate limited, retrying in %.1fs (attempt %d/%d)",
+                                        delay,
+                                        attempt,
+                                        MAX_RETRIES,
+                                    )
+                                continue
+
+                        _LOGGER.warning("Rate limit exceeded")
+                        raise AutoPiRateLimitError(
+                            "Rate limit exceeded", status_code=response.status
                         )
-                    else:
+
+                    if response.status >= 500:
+                        response_text = await response.text()
                         _LOGGER.error(
-                            "Client error %d: %s", response.status, response_text
+                            "Server error %d: %s", response.status, response_text
                         )
-                    raise AutoPiAPIError(
-                        f"Client error: {response.status}",
-                        status_code=response.status,
-                        data={"response": response_text},
-                    )
-
-                if response.status == 204:
-                    # No content
-                    return {}
 
-                try:
-                    return await response.json()
-                except Exception as err:
-                    _LOGGER.exception(
-                        "Failed to parse JSON response: %s", response_text
-                    )
-                    raise AutoPiAPIError(
-                        "Invalid JSON response from API",
-                        data={"response": response_text},
-                    ) from err
+                        # Retry on server errors
+                        if attempt < MAX_RETRIES:
+                            delay = _retry_delay(
+                                attempt, response.headers.get("Retry-After")
+                            )
+                            # A longer wait would stall the update; give up
+                            if delay <= MAX_BACKOFF:
+                                attempt += 1
+                                if debug:
+                                    _LOGGER.debug(
+                                        "Retrying request after server error (attempt %d/%d)",
+                                        attempt,
+                                        MAX_RETRIES,
+                                    )
+                                continue
+
+                        raise AutoPiAPIError(
+                            f"Server error: {response.status}",
+                            status_code=response.status,
+                            data={"response": response_text},
+                        )
 
-        except AutoPiError:
-            # Re-raise our custom exceptions without modification
-            raise
+                    if response.status >= 400:
+                        response_text = await response.text()
+                        if response.status == 404:
+                            _LOGGER.debug(
+                                "Resource not found (%s): %s", endpoint, response_text
+                            )
+                        else:
+                            _LOGGER.error(
+                                "Client error %d: %s", response.status, response_text
+                            )
+                        raise AutoPiAPIError(
+                            f"Client error: {response.status}",
+                            status_code=response.status,
+                            data={"response": response_text},
+                        )
 
-        except TimeoutError as err:
-            _LOGGER.exception("Request timeout for %s %s", method, url)
-            raise AutoPiTimeoutError(f"Request timeout for {method} {url}") from err
+                    if response.status == 304:
+                        # Not modified since the validators in the request headers
+                        return _APIResponse(response.status, None, response.headers)
 
-        except ClientError as err:
-            _LOGGER.exception("Connection error for %s %s", method, url)
+                    if response.status == 204:
+                        # No content
+                        return _APIResponse(response.status, {}, response.headers)
 
-            # Retry on connection errors
-            if retry_count < MAX_RETRIES:
-                _LOGGER.debug(
-                    "Retrying request after connection error (attempt %d/%d)",
-                    retry_count + 1,
-                    MAX_RETRIES,
-                )
-                await asyncio.sleep(RETRY_DELAY * (retry_count + 1))
-                return await self._request(
-                    method, endpoint, data, params, retry_count + 1
-                )
+                    try:
+                        # Home Assistant's json_loads is backed by orjson, which
+                        # is much faster than aiohttp's default stdlib decoder
+                        return _APIResponse(
+                            response.status,
+                            await response.json(loads=json_loads),
+                            response.headers,
+                        )
+                    except Exception as err:
+                        # The body is already buffered, so this does not re-read it
+                        response_text = await response.text()
+                        _LOGGER.exception(
+                            "Failed to parse JSON response: %s", response_text
+                        )
+                        raise AutoPiAPIError(
+                            "Invalid JSON response from API",
+                            data={"response": response_text},
+                        ) from err
+
+            except AutoPiError:
+                # Re-raise our custom exceptions without modification
+                raise
+
+            except TimeoutError as err:
+                _LOGGER.exception("Request timeout for %s %s", method, url)
+                raise AutoPiTimeoutError(f"Request timeout for {method} {url}") from err
+
+            except ClientError as err:
+                _LOGGER.exception("Connection error for %s %s", method, url)
+
+                # Retry on connection errors
+                if attempt < MAX_RETRIES:
+                    delay = _retry_delay(attempt)
+                    attempt += 1
+                    if debug:
+                        _LOGGER.debug(
+                            "Retrying request after connection error (attempt %d/%d)",
+                            attempt,
+                            MAX_RETRIES,
+                        )
+                    continue
 
-            raise AutoPiConnectionError(
-                f"Failed to connect to AutoPi API: {err}"
-            ) from err
+                raise AutoPiConnectionError(
+                    f"Failed to connect to AutoPi API: {err}"
+                ) from err
 
-        except Exception as err:
-            _LOGGER.exception("Unexpected error during %s %s", method, url)
-            raise AutoPiAPIError(f"Unexpected error: {err}") from err
+            except Exception as err:
+                _LOGGER.exception("Unexpected error during %s %s", method, url)
+                raise AutoPiAPIError(f"Unexpected error: {err}") from err
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 from .const import (
     CONF_API_KEY,
+    CONF_AUTO_ZERO_ENABLED,
     CONF_BASE_URL,
     CONF_DISCOVERY_ENABLED,
     CONF_SELECTED_VEHICLES,
@@ -60,6 +61,25 @@ def _format_utc(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
+def _summarize_charging_session(
+    session: ChargingSession | None,
+) -> tuple[bool | None, dict[str, Any]]:
+    """Return the charging state and entity attributes for a session."""
+    if session is None:
+        return None, {}
+    charging = session.end is None or (
+        session.state is not None and session.state.lower() in {"charging", "active"}
+    )
+    return charging, {
+        "last_charge_start": session.start.isoformat() if session.start else None,
+        "last_charge_end": session.end.isoformat() if session.end else None,
+        "last_charge_duration_seconds": session.duration_seconds,
+        "last_charge_state": session.state,
+        "start_tag": session.start_tag,
+        "end_tag": session.end_tag,
+    }
+
+
 # Optional API endpoint feature keys (used for support tracking)
 ENDPOINT_KEY_CHARGING_SESSIONS = "charging_sessions"
 ENDPOINT_KEY_DIAGNOSTICS = "diagnostics"
@@ -115,8 +135,9 @@ class AutoPiDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self._fleet_alert_summary: FleetAlertSummary | None = None
         self._vehicle_alerts: dict[str, dict[str, Any]] = {}
 
-        # Charging sessions per vehicle
-        self._charging_sessions: dict[str, ChargingSession | None] = {}
+        # Charging state and attributes per vehicle, derived from the latest
+        # session when it is fetched so entity reads are plain lookups
+        self._charging_summaries: dict[str, tuple[bool | None, dict[str, Any]]] = {}
 
         # Diagnostic data
         self._vehicle_diagnostics: dict[str, dict[str, Any]] = {}
@@ -495,14 +516,16 @@ class AutoPiDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
                                     session.start or datetime.min.replace(tzinfo=UTC)
                                 ),
                             )
-                        self._charging_sessions[vehicle_id] = latest_session
+                        self._charging_summaries[vehicle_id] = (
+                            _summarize_charging_session(latest_session)
+                        )
                     except AutoPiAPIError as err:
                         self._failed_api_calls += 1
                         if err.status_code == 404:
                             self._record_unsupported_endpoint(
                                 ENDPOINT_KEY_CHARGING_SESSIONS, vehicle_id
                             )
-                            self._charging_sessions.pop(vehicle_id, None)
+                            self._charging_summaries.pop(vehicle_id, None)
                         else:
                             _LOGGER.warning(
                                 "Failed to fetch charging sessions for vehicle %s: %s",
@@ -1104,30 +1127,15 @@ class AutoPiDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         """Return charging state for a vehicle."""
         if not self.is_endpoint_supported(ENDPOINT_KEY_CHARGING_SESSIONS, vehicle_id):
             return None
-        session = self._charging_sessions.get(vehicle_id)
-        if session is None:
-            return None
-        if session.end is None:
-            return True
-        if session.state and session.state.lower() in {"charging", "active"}:
-            return True
-        return False
+        summary = self._charging_summaries.get(vehicle_id)
+        return summary[0] if summary is not None else None
 
     def get_vehicle_charging_info(self, vehicle_id: str) -> dict[str, Any]:
         """Return charging info for a vehicle."""
         if not self.is_endpoint_supported(ENDPOINT_KEY_CHARGING_SESSIONS, vehicle_id):
             return {}
-        session = self._charging_sessions.get(vehicle_id)
-        if session is None:
-            return {}
-        return {
-            "last_charge_start": session.start.isoformat() if session.start else None,
-            "last_charge_end": session.end.isoformat() if session.end else None,
-            "last_charge_duration_seconds": session.duration_seconds,
-            "last_charge_state": session.state,
-            "start_tag": session.start_tag,
-            "end_tag": session.end_tag,
-        }
+        summary = self._charging_summaries.get(vehicle_id)
+        return summary[1] if summary is not None else {}
 
     def get_vehicle_dtc_entries(self, vehicle_id: str) -> list[DtcEntry]:
         """Return DTC entries for a vehicle."""
@@ -1723,6 +1731,25 @@ class AutoPiPositionCoordinator(AutoPiDataUpdateCoordinator):
                 self.success_rate,
             )
 
+            # Evaluate auto-zero for every vehicle once per tick so the data
+            # field sensors only need to read the resulting state
+            if self.config_entry.options.get(CONF_AUTO_ZERO_ENABLED, False):
+                from .auto_zero import AUTO_ZERO_METRIC_IDS, get_auto_zero_manager
+
+                try:
+                    get_auto_zero_manager().evaluate_batch(
+                        (
+                            (vehicle_id, metric_id, vehicle.data_fields.get(metric_id))
+                            for vehicle_id, vehicle in data.items()
+                            if vehicle.data_fields
+                            for metric_id in AUTO_ZERO_METRIC_IDS
+                        ),
+                        True,
+                    )
+                except Exception:
+                    # Auto-zero is secondary; never fail the position update
+                    _LOGGER.exception("Error evaluating auto-zero metrics")
+
             _LOGGER.debug(
                 "Position coordinator update #%d completed successfully (next update in %s)",
                 self._update_count,
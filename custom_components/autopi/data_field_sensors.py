@@ -26,7 +26,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .auto_zero import AUTO_ZERO_METRICS, get_auto_zero_manager
+from .auto_zero import AUTO_ZERO_METRIC_IDS, get_auto_zero_manager
 from .const import (
     CONF_AUTO_ZERO_ENABLED,
     CONF_SUPPRESS_ACCEL_WHEN_STATIONARY,
@@ -75,15 +75,18 @@ class AutoPiDataFieldSensorBase(AutoPiVehicleEntity, SensorEntity):
             name,
             vehicle_id,
             field_id,
-            field_id in AUTO_ZERO_METRICS,
+            field_id in AUTO_ZERO_METRIC_IDS,
         )
 
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
+        # Read on every state write; skip building debug arguments such as
+        # isoformat() strings unless they will be emitted
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         try:
             # Check if auto-zero is enabled and this metric supports it
-            if self._field_id in AUTO_ZERO_METRICS:
+            if self._field_id in AUTO_ZERO_METRIC_IDS:
                 auto_zero_enabled = self.coordinator.config_entry.options.get(
                     CONF_AUTO_ZERO_ENABLED, False
                 )
@@ -98,11 +101,12 @@ class AutoPiDataFieldSensorBase(AutoPiVehicleEntity, SensorEntity):
                     ):
                         field_data = self._get_field_data()
                         if field_data is None:
-                            _LOGGER.debug(
-                                "Sensor %s for vehicle %s is marked as zeroed and no data available, returning 0",
-                                self._attr_name,
-                                self._vehicle_id,
-                            )
+                            if debug:
+                                _LOGGER.debug(
+                                    "Sensor %s for vehicle %s is marked as zeroed and no data available, returning 0",
+                                    self._attr_name,
+                                    self._vehicle_id,
+                                )
                             return 0
 
             field_data = self._get_field_data()
@@ -112,43 +116,44 @@ class AutoPiDataFieldSensorBase(AutoPiVehicleEntity, SensorEntity):
                 self._last_known_value = field_data.last_value
                 self._last_update_time = field_data.last_update
 
-                _LOGGER.debug(
-                    "Sensor %s for vehicle %s has value %s (last_seen: %s)",
-                    self._attr_name,
-                    self._vehicle_id,
-                    field_data.last_value,
-                    field_data.last_seen.isoformat()
-                    if field_data.last_seen
-                    else "None",
-                )
-
-                # Check if auto-zero should be applied
-                if self._field_id in AUTO_ZERO_METRICS:
-                    auto_zero_enabled = self.coordinator.config_entry.options.get(
-                        CONF_AUTO_ZERO_ENABLED, False
-                    )
+                if debug:
                     _LOGGER.debug(
-                        "Auto-zero check for %s on vehicle %s: enabled=%s, field_id=%s, options=%s",
+                        "Sensor %s for vehicle %s has value %s (last_seen: %s)",
                         self._attr_name,
                         self._vehicle_id,
-                        auto_zero_enabled,
-                        self._field_id,
-                        self.coordinator.config_entry.options,
+                        field_data.last_value,
+                        field_data.last_seen.isoformat()
+                        if field_data.last_seen
+                        else "None",
                     )
 
-                    # Check if we should zero the metric
-                    auto_zero_manager = get_auto_zero_manager()
-                    if auto_zero_manager.should_zero_metric(
-                        self._vehicle_id,
-                        self._field_id,
-                        field_data,
-                        auto_zero_enabled,
-                    ):
+                # Check if auto-zero should be applied
+                if self._field_id in AUTO_ZERO_METRIC_IDS:
+                    auto_zero_enabled = self.coordinator.config_entry.options.get(
+                        CONF_AUTO_ZERO_ENABLED, False
+                    )
+                    if debug:
                         _LOGGER.debug(
-                            "Auto-zeroing sensor %s for vehicle %s",
+                            "Auto-zero check for %s on vehicle %s: enabled=%s, field_id=%s, options=%s",
                             self._attr_name,
                             self._vehicle_id,
+                            auto_zero_enabled,
+                            self._field_id,
+                            self.coordinator.config_entry.options,
                         )
+
+                    # The coordinator evaluates auto-zero for all vehicles on
+                    # each update, so only the resulting state is read here
+                    auto_zero_manager = get_auto_zero_manager()
+                    if auto_zero_enabled and auto_zero_manager.is_metric_zeroed(
+                        self._vehicle_id, self._field_id
+                    ):
+                        if debug:
+                            _LOGGER.debug(
+                                "Auto-zeroing sensor %s for vehicle %s",
+                                self._attr_name,
+                                self._vehicle_id,
+                            )
                         return 0
 
                 return field_data.last_value
@@ -161,14 +166,15 @@ class AutoPiDataFieldSensorBase(AutoPiVehicleEntity, SensorEntity):
                 if datetime.now(UTC) - self._last_update_time < timedelta(
                     minutes=DATA_FIELD_TIMEOUT_MINUTES
                 ):
-                    _LOGGER.debug(
-                        "[SENSOR CACHE] Using cached value %s for sensor %s on vehicle %s (last update: %.1f min ago)",
-                        self._last_known_value,
-                        self._attr_name,
-                        self._vehicle_id,
-                        (datetime.now(UTC) - self._last_update_time).total_seconds()
-                        / 60,
-                    )
+                    if debug:
+                        _LOGGER.debug(
+                            "[SENSOR CACHE] Using cached value %s for sensor %s on vehicle %s (last update: %.1f min ago)",
+                            self._last_known_value,
+                            self._attr_name,
+                            self._vehicle_id,
+                            (datetime.now(UTC) - self._last_update_time).total_seconds()
+                            / 60,
+                        )
                     return self._last_known_value
 
             _LOGGER.debug(
@@ -235,10 +241,10 @@ class AutoPiDataFieldSensorBase(AutoPiVehicleEntity, SensorEntity):
                 attrs["data_age_seconds"] = int(time_since_update.total_seconds())
 
         # Always show auto-zero enabled status
-        attrs["auto_zero_enabled"] = self._field_id in AUTO_ZERO_METRICS
+        attrs["auto_zero_enabled"] = self._field_id in AUTO_ZERO_METRIC_IDS
 
         # Add detailed auto-zero status if enabled
-        if self._field_id in AUTO_ZERO_METRICS:
+        if self._field_id in AUTO_ZERO_METRIC_IDS:
             auto_zero_manager = get_auto_zero_manager()
             auto_zero_status = auto_zero_manager.get_metric_status(
                 self._vehicle_id, self._field_id
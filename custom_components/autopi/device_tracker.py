@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
@@ -17,6 +17,9 @@ from .const import (
 from .coordinator import AutoPiDataUpdateCoordinator
 from .entities.base import AutoPiVehicleEntity
 
+if TYPE_CHECKING:
+    from . import AutoPiEntryData
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -26,8 +29,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up AutoPi device tracker from a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    position_coordinator: AutoPiDataUpdateCoordinator = data["position_coordinator"]
+    data: AutoPiEntryData = hass.data[DOMAIN][config_entry.entry_id]
+    position_coordinator: AutoPiDataUpdateCoordinator = data.position
 
     # Create device tracker entities for all vehicles with position data
     entities = [
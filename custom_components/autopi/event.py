@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.event import EventEntity
 from homeassistant.config_entries import ConfigEntry
@@ -20,6 +20,9 @@ from .coordinator import (
 )
 from .entities.base import AutoPiVehicleEntity
 
+if TYPE_CHECKING:
+    from . import AutoPiEntryData
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -347,9 +350,8 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up AutoPi event entities")
 
     # Get the coordinator from hass data
-    coordinator: AutoPiDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][
-        "coordinator"
-    ]
+    data: AutoPiEntryData = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: AutoPiDataUpdateCoordinator = data.base
 
     # Create event entities for each vehicle
     entities: list[EventEntity] = []
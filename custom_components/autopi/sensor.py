@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -35,6 +35,9 @@ from .data_field_sensors import create_data_field_sensors
 from .entities.base import AutoPiEntity, AutoPiVehicleEntity
 from .position_sensors import create_position_sensors
 
+if TYPE_CHECKING:
+    from . import AutoPiEntryData
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -44,11 +47,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up AutoPi sensors from a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    coordinator: AutoPiDataUpdateCoordinator = data["coordinator"]
-    position_coordinator: AutoPiDataUpdateCoordinator = data["position_coordinator"]
-    trip_coordinator: AutoPiDataUpdateCoordinator = data.get("trip_coordinator")
-    all_coordinators = data["coordinators"]
+    data: AutoPiEntryData = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: AutoPiDataUpdateCoordinator = data.base
+    position_coordinator: AutoPiDataUpdateCoordinator = data.position
+    trip_coordinator: AutoPiDataUpdateCoordinator = data.trip
+    all_coordinators = data.coordinators
 
     _LOGGER.debug(
         "Setting up AutoPi sensors for config entry %s", config_entry.entry_id
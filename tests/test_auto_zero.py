@@ -0,0 +1,261 @@
+"""Tests for the AutoPi auto-zero manager."""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.autopi.auto_zero import (
+    SAVE_DELAY_SECONDS,
+    AutoZeroManager,
+    _AutoZeroStore,
+)
+from custom_components.autopi.types import DataFieldValue
+
+VEHICLE_ID = "123"
+METRIC_ID = "obd.rpm.value"
+
+
+def _field(age: timedelta) -> DataFieldValue:
+    """Create an RPM data field last seen ``age`` ago."""
+    now = datetime.now(UTC)
+    return DataFieldValue(
+        field_prefix="obd.rpm",
+        field_name="value",
+        frequency=1.0,
+        value_type="float",
+        title="Engine RPM",
+        last_seen=now - age,
+        last_value=850,
+        description="",
+        last_update=now,
+    )
+
+
+def test_stale_metric_is_zeroed_and_fresh_data_unzeroes() -> None:
+    """Test metrics are zeroed when stale and restored when fresh."""
+    manager = AutoZeroManager()
+
+    assert manager.should_zero_metric(
+        VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=30)), True
+    )
+    assert manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+
+    assert not manager.should_zero_metric(
+        VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=1)), True
+    )
+    assert not manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+
+
+def test_disabled_or_untracked_metric_is_never_zeroed() -> None:
+    """Test the feature flag and metric allow-list gate zeroing."""
+    manager = AutoZeroManager()
+    stale = _field(timedelta(minutes=30))
+
+    assert not manager.should_zero_metric(VEHICLE_ID, METRIC_ID, stale, False)
+    assert not manager.should_zero_metric(VEHICLE_ID, "obd.bat.voltage", stale, True)
+    assert not manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+    assert not manager.is_metric_zeroed(VEHICLE_ID, "obd.bat.voltage")
+
+
+def test_state_change_schedules_delayed_save() -> None:
+    """Test state changes hand the payload builder to Store's delayed save."""
+    manager = AutoZeroManager()
+    manager._store = MagicMock()
+
+    manager.should_zero_metric(
+        VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=30)), True
+    )
+
+    manager._store.async_delay_save.assert_called_once_with(
+        manager._build_storage_data, SAVE_DELAY_SECONDS
+    )
+    assert manager._build_storage_data() == {
+        "zeroed_metrics": [
+            (
+                VEHICLE_ID,
+                METRIC_ID,
+                manager._get_zeroed_at(VEHICLE_ID, METRIC_ID).isoformat(),
+            )
+        ]
+    }
+    assert not manager._dirty
+
+
+async def test_save_only_writes_pending_changes() -> None:
+    """Test an immediate save is skipped when nothing is pending."""
+    manager = AutoZeroManager()
+    manager._store = MagicMock()
+    manager._store.async_save = AsyncMock()
+    manager._set_zeroed_at(VEHICLE_ID, METRIC_ID, datetime.now(UTC))
+
+    manager._dirty = True
+    await manager._async_save()
+    await manager._async_save()
+
+    manager._store.async_save.assert_awaited_once()
+
+
+def test_cleanup_old_data_drops_expired_entries() -> None:
+    """Test cleanup keeps recent zeroed metrics and drops old ones."""
+    manager = AutoZeroManager()
+    now = datetime.now(UTC)
+    manager._set_zeroed_at(VEHICLE_ID, METRIC_ID, now - timedelta(hours=1))
+    manager._set_zeroed_at(VEHICLE_ID, "obd.speed.value", now - timedelta(hours=30))
+
+    manager.cleanup_old_data()
+
+    assert manager._zeroed_metrics.keys() == {VEHICLE_ID}
+    assert list(manager._zeroed_metrics[VEHICLE_ID]) == [METRIC_ID]
+
+
+def test_evaluate_batch_schedules_one_save() -> None:
+    """Test batch evaluation zeroes stale metrics and schedules one save."""
+    manager = AutoZeroManager()
+    manager._store = MagicMock()
+    updates = [
+        (VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=30))),
+        (VEHICLE_ID, "obd.speed.value", _field(timedelta(minutes=1))),
+        (VEHICLE_ID, "obd.bat.voltage", _field(timedelta(minutes=30))),
+        (VEHICLE_ID, "obd.engine_load.value", None),
+    ]
+
+    manager.evaluate_batch(updates, True)
+
+    assert manager._zeroed_metrics == {VEHICLE_ID: {METRIC_ID: updates[0][2].last_seen}}
+    manager._store.async_delay_save.assert_called_once()
+
+
+async def test_load_restores_recent_and_skips_invalid_entries() -> None:
+    """Test loading keeps recent entries and ignores old or malformed ones."""
+    now = datetime.now(UTC)
+    manager = AutoZeroManager()
+    manager._store = MagicMock()
+    manager._store.async_load = AsyncMock(
+        return_value={
+            "zeroed_metrics": [
+                [VEHICLE_ID, METRIC_ID, (now - timedelta(hours=1)).isoformat()],
+                [
+                    VEHICLE_ID,
+                    "obd.speed.value",
+                    (now - timedelta(hours=30)).isoformat(),
+                ],
+                [VEHICLE_ID, "obd.rpm.value"],
+                [VEHICLE_ID, "obd.engine_load.value", "not-a-date"],
+            ]
+        }
+    )
+
+    await manager._async_load()
+
+    assert manager._zeroed_metrics.keys() == {VEHICLE_ID}
+    assert list(manager._zeroed_metrics[VEHICLE_ID]) == [METRIC_ID]
+
+
+async def test_reset_flushes_and_clears_state() -> None:
+    """Test reset writes pending changes and forgets runtime state."""
+    manager = AutoZeroManager()
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    manager._store = store
+    manager._set_zeroed_at(VEHICLE_ID, METRIC_ID, datetime.now(UTC))
+    manager._dirty = True
+
+    await manager.async_reset()
+
+    store.async_save.assert_awaited_once()
+    assert not manager._zeroed_metrics
+    assert not manager.is_initialized
+
+
+async def test_store_migrates_v1_objects_to_rows(hass: HomeAssistant) -> None:
+    """Test version 1 keyed objects are migrated to compact rows."""
+    store = _AutoZeroStore(hass, 2, "autopi_auto_zero_test")
+
+    migrated = await store._async_migrate_func(
+        1,
+        1,
+        {
+            "zeroed_metrics": [
+                {
+                    "vehicle_id": VEHICLE_ID,
+                    "field_id": METRIC_ID,
+                    "zeroed_at": "2025-07-29T10:30:00+00:00",
+                },
+                {"vehicle_id": VEHICLE_ID},
+            ]
+        },
+    )
+
+    assert migrated == {
+        "zeroed_metrics": [(VEHICLE_ID, METRIC_ID, "2025-07-29T10:30:00+00:00")]
+    }
+
+
+async def test_store_defers_unknown_versions_to_base_store(
+    hass: HomeAssistant,
+) -> None:
+    """Test versions without a migration fall through to Store."""
+    store = _AutoZeroStore(hass, 2, "autopi_auto_zero_test")
+
+    with pytest.raises(NotImplementedError):
+        await store._async_migrate_func(3, 1, {"zeroed_metrics": []})
+
+
+def test_last_seen_refresh_does_not_schedule_save() -> None:
+    """Test an already-zeroed metric only schedules a save on state change."""
+    manager = AutoZeroManager()
+    manager._store = MagicMock()
+    manager._set_zeroed_at(
+        VEHICLE_ID, METRIC_ID, datetime.now(UTC) - timedelta(hours=1)
+    )
+
+    assert manager.should_zero_metric(
+        VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=30)), True
+    )
+    manager.evaluate_batch(
+        [(VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=20)))], True
+    )
+    assert manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+
+    manager._store.async_delay_save.assert_not_called()
+
+
+def test_is_metric_zeroed_debug_handles_naive_timestamps(caplog) -> None:
+    """Test debug logging copes with a naive zeroed-at timestamp."""
+    caplog.set_level(logging.DEBUG, logger="custom_components.autopi.auto_zero")
+    manager = AutoZeroManager()
+    manager._set_zeroed_at(VEHICLE_ID, METRIC_ID, datetime.now())
+
+    assert manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+
+
+def test_should_zero_metric_ignores_missing_field_data() -> None:
+    """Test a zeroed metric without current data is left as it is."""
+    manager = AutoZeroManager()
+    manager._set_zeroed_at(VEHICLE_ID, METRIC_ID, datetime.now(UTC))
+
+    assert not manager.should_zero_metric(VEHICLE_ID, METRIC_ID, None, True)
+    assert manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+
+
+def test_evaluate_batch_skips_metrics_with_mixed_timezones() -> None:
+    """Test a naive timestamp fails safe for its metric only."""
+    manager = AutoZeroManager()
+    naive = _field(timedelta(minutes=30))
+    naive.last_seen = naive.last_seen.replace(tzinfo=None)
+
+    manager.evaluate_batch(
+        [
+            (VEHICLE_ID, METRIC_ID, _field(timedelta(minutes=30))),
+            (VEHICLE_ID, "obd.speed.value", naive),
+        ],
+        True,
+    )
+
+    assert manager.is_metric_zeroed(VEHICLE_ID, METRIC_ID)
+    assert not manager.is_metric_zeroed(VEHICLE_ID, "obd.speed.value")
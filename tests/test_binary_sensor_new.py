@@ -7,9 +7,14 @@ from unittest.mock import Mock
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.autopi.binary_sensor import async_setup_entry
+from custom_components.autopi import AutoPiEntryData
+from custom_components.autopi.binary_sensor import (
+    BatteryChargingStateBinarySensor,
+    TrackerOnlineBinarySensor,
+    async_setup_entry,
+)
 from custom_components.autopi.const import DOMAIN
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from custom_components.autopi.types import AutoPiVehicle, DataFieldValue
 
@@ -71,10 +76,12 @@ class TestBinarySensorSetup:
         position_coordinator.is_endpoint_supported = Mock(return_value=True)
 
         hass.data[DOMAIN] = {
-            mock_entry.entry_id: {
-                "coordinator": base_coordinator,
-                "position_coordinator": position_coordinator,
-            }
+            mock_entry.entry_id: AutoPiEntryData(
+                base=base_coordinator,
+                position=position_coordinator,
+                trip=Mock(),
+                update_interval_minutes=1,
+            )
         }
 
         added_entities = []
@@ -111,10 +118,12 @@ class TestBinarySensorSetup:
         position_coordinator.is_endpoint_supported = Mock(return_value=True)
 
         hass.data[DOMAIN] = {
-            mock_entry.entry_id: {
-                "coordinator": base_coordinator,
-                "position_coordinator": position_coordinator,
-            }
+            mock_entry.entry_id: AutoPiEntryData(
+                base=base_coordinator,
+                position=position_coordinator,
+                trip=Mock(),
+                update_interval_minutes=1,
+            )
         }
 
         await async_setup_entry(hass, mock_entry, mock_add_entities)
@@ -123,3 +132,97 @@ class TestBinarySensorSetup:
             "Adding" in record.message and "binary sensor" in record.message
             for record in caplog.records
         )
+
+
+class TestDataFieldBinarySensors:
+    """Test data field derived binary sensor state parsing."""
+
+    def _coordinator(self, value) -> Mock:
+        """Create a coordinator holding an ``obd.bat.state`` reading."""
+        now = datetime.now(UTC)
+        vehicle = Mock()
+        vehicle.data_fields = {
+            "obd.bat.state": DataFieldValue(
+                field_prefix="obd.bat",
+                field_name="state",
+                frequency=1.0,
+                value_type="string",
+                title="Battery Charging State",
+                last_seen=now,
+                last_value=value,
+                description="",
+                last_update=now,
+            )
+        }
+        coordinator = Mock()
+        coordinator.data = {"123": vehicle}
+        coordinator.config_entry.entry_id = "test_entry"
+        return coordinator
+
+    def test_string_states_are_parsed(self):
+        """Test string readings map to charging states, reusing repeats."""
+        coordinator = self._coordinator(" Charging ")
+        sensor = BatteryChargingStateBinarySensor(coordinator, "123")
+
+        assert sensor.is_on is True
+        assert sensor.is_on is True
+        assert sensor._last_parse == (" Charging ", True)
+
+        coordinator.data["123"].data_fields["obd.bat.state"].last_value = "idle"
+        assert sensor.is_on is False
+
+        coordinator.data["123"].data_fields["obd.bat.state"].last_value = "bogus"
+        assert sensor.is_on is None
+
+    def test_field_data_is_cached_until_coordinator_update(self):
+        """Test field data is looked up once per coordinator update."""
+        coordinator = self._coordinator("charging")
+        sensor = BatteryChargingStateBinarySensor(coordinator, "123")
+        sensor.async_write_ha_state = Mock()
+
+        assert sensor.is_on is True
+        coordinator.data = {}
+        assert sensor.is_on is True
+
+        sensor._handle_coordinator_update()
+        assert sensor._get_field_data() is None
+
+    def test_last_known_value_keeps_sensor_available_until_timeout(self):
+        """Test a vanished field stays available only while recently seen."""
+        coordinator = self._coordinator("charging")
+        sensor = BatteryChargingStateBinarySensor(coordinator, "123")
+        sensor.async_write_ha_state = Mock()
+        assert sensor.is_on is True
+
+        coordinator.data["123"].data_fields = {}
+        sensor._handle_coordinator_update()
+        assert sensor.available
+
+        sensor._last_update_time = datetime.now(UTC) - timedelta(days=1)
+        sensor._handle_coordinator_update()
+        assert not sensor.available
+
+
+class TestTrackerOnlineBinarySensor:
+    """Test the tracker online binary sensor."""
+
+    def test_online_threshold_is_cached_until_coordinator_update(self):
+        """Test the threshold is read lazily and refreshed on each update."""
+        coordinator = Mock()
+        coordinator.config_entry.entry_id = "test_entry"
+        coordinator.get_online_threshold = Mock(return_value=timedelta(minutes=5))
+        coordinator.get_last_communication = Mock(
+            return_value=datetime.now(UTC) - timedelta(minutes=1)
+        )
+        sensor = TrackerOnlineBinarySensor(coordinator, "123")
+        sensor.async_write_ha_state = Mock()
+        coordinator.get_online_threshold.assert_not_called()
+
+        assert sensor.is_on is True
+        assert sensor.is_on is True
+        coordinator.get_online_threshold.assert_called_once()
+
+        coordinator.get_online_threshold.return_value = timedelta(seconds=30)
+        sensor._handle_coordinator_update()
+        assert sensor.is_on is False
+        assert coordinator.get_online_threshold.call_count == 2
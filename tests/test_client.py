@@ -1,11 +1,20 @@
 """Tests for AutoPi API client."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import pytest
-
-from custom_components.autopi.client import AutoPiClient
+from homeassistant.util.json import json_loads
+
+from custom_components.autopi.client import (
+    MAX_BACKOFF,
+    MAX_RETRIES,
+    RETRY_DELAY,
+    RETRY_JITTER,
+    AutoPiClient,
+    _retry_delay,
+)
 from custom_components.autopi.const import (
     DEFAULT_BASE_URL,
     VEHICLE_PROFILE_ENDPOINT,
@@ -92,6 +101,9 @@ class TestAutoPiClient:
         assert vehicles[0].id == 123
         assert vehicles[0].name == "Test"
         assert vehicles[0].license_plate == "ABC123"
+        # The body is only decoded as text for error responses
+        mock_response.text.assert_not_awaited()
+        mock_response.json.assert_awaited_once_with(loads=json_loads)
 
         # Verify API call
         mock_session.request.assert_called_once()
@@ -99,6 +111,8 @@ class TestAutoPiClient:
         assert call_args[0][0] == "GET"
         assert VEHICLE_PROFILE_ENDPOINT in call_args[0][1]
         assert call_args[1]["headers"]["Authorization"] == "APIToken test_api_key"
+        # GET requests carry no body, so no Content-Type is sent
+        assert "Content-Type" not in call_args[1]["headers"]
 
     @pytest.mark.asyncio
     async def test_get_vehicles_pagination(self, client, mock_session):
@@ -187,9 +201,15 @@ class TestAutoPiClient:
 
         mock_session.request.return_value = create_async_context_manager(mock_response)
 
-        with pytest.raises(AutoPiRateLimitError):
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(AutoPiRateLimitError),
+        ):
             await client.get_vehicles()
 
+        # Rate limiting is retried before the error is surfaced
+        assert mock_session.request.call_count == MAX_RETRIES + 1
+
     @pytest.mark.asyncio
     async def test_get_vehicles_connection_error(self, client, mock_session):
         """Test connection error handling."""
@@ -314,3 +334,187 @@ class TestAutoPiClient:
 
         assert vehicles == []
         assert mock_session.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_vehicles_not_modified(self, client, mock_session):
+        """Test unchanged vehicle profiles are reused from a 304 response."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {"ETag": '"abc"'}
+        mock_response.text = AsyncMock(return_value="")
+        mock_response.json = AsyncMock(
+            return_value={
+                "results": [
+                    {
+                        "id": 123,
+                        "display_name": "Test Vehicle",
+                        "callName": "Test",
+                        "licensePlate": "ABC123",
+                        "vin": "1234567890",
+                        "year": 2020,
+                        "type": "ICE",
+                        "battery_nominal_voltage": 12,
+                        "devices": [{"id": "device1"}],
+                        "make": {"id": 1},
+                        "model": {"id": 1},
+                    }
+                ],
+            }
+        )
+        not_modified = Mock()
+        not_modified.status = 304
+        not_modified.headers = {}
+        not_modified.text = AsyncMock(return_value="")
+        not_modified.json = AsyncMock(side_effect=AssertionError("body parsed"))
+
+        mock_session.request.side_effect = [
+            create_async_context_manager(mock_response),
+            create_async_context_manager(not_modified),
+        ]
+
+        first = await client.get_vehicles()
+        second = await client.get_vehicles()
+
+        assert [v.id for v in second] == [v.id for v in first] == [123]
+        assert (
+            "If-None-Match" not in mock_session.request.call_args_list[0][1]["headers"]
+        )
+        assert (
+            mock_session.request.call_args_list[1][1]["headers"]["If-None-Match"]
+            == '"abc"'
+        )
+
+    @pytest.mark.asyncio
+    async def test_connection_error_retries_then_raises(self, client, mock_session):
+        """Test connection errors are retried up to the limit before raising."""
+        mock_session.request.side_effect = aiohttp.ClientError("Connection failed")
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(AutoPiConnectionError),
+        ):
+            await client.get_vehicles()
+
+        assert mock_session.request.call_count == MAX_RETRIES + 1
+        assert mock_sleep.await_count == MAX_RETRIES
+
+    def test_retry_delay_backs_off_with_jitter(self):
+        """Test retry delays double per retry with bounded jitter."""
+        for retry in range(MAX_RETRIES):
+            delay = _retry_delay(retry)
+            base = min(MAX_BACKOFF, RETRY_DELAY * 2**retry)
+            assert base <= delay <= base + RETRY_JITTER
+
+    def test_retry_delay_honors_retry_after(self):
+        """Test Retry-After seconds and dates override the backoff."""
+        assert _retry_delay(0, "5") == 5
+        assert _retry_delay(0, str(MAX_BACKOFF)) == MAX_BACKOFF
+        assert _retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert 1 <= _retry_delay(0, "soon") <= 1 + RETRY_JITTER
+
+    def test_retry_delay_reports_retry_after_above_cap(self):
+        """Test a long Retry-After is returned as is for callers to reject."""
+        assert _retry_delay(0, "3600") == 3600
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_with_long_retry_after_raises(self, client, mock_session):
+        """Test a rate-limited request is not retried past MAX_BACKOFF."""
+        rate_limited = Mock()
+        rate_limited.status = 429
+        rate_limited.headers = {"Retry-After": "3600"}
+        rate_limited.text = AsyncMock(return_value="Rate limit exceeded")
+        mock_session.request.return_value = create_async_context_manager(rate_limited)
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(AutoPiRateLimitError),
+        ):
+            await client.get_vehicles()
+
+        mock_sleep.assert_not_awaited()
+        assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retry_honors_retry_after(self, client, mock_session):
+        """Test a rate-limited request waits for Retry-After and then succeeds."""
+        rate_limited = Mock()
+        rate_limited.status = 429
+        rate_limited.headers = {"Retry-After": "2"}
+        rate_limited.text = AsyncMock(return_value="Rate limit exceeded")
+
+        success = Mock()
+        success.status = 200
+        success.headers = {}
+        success.json = AsyncMock(return_value={"results": []})
+
+        mock_session.request.side_effect = [
+            create_async_context_manager(rate_limited),
+            create_async_context_manager(success),
+        ]
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            vehicles = await client.get_vehicles()
+
+        assert vehicles == []
+        mock_sleep.assert_awaited_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_server_error_with_long_retry_after_raises(
+        self, client, mock_session
+    ):
+        """Test a 503 asking for a long wait fails as a server error."""
+        unavailable = Mock()
+        unavailable.status = 503
+        unavailable.headers = {"Retry-After": "120"}
+        unavailable.text = AsyncMock(return_value="Down for maintenance")
+        mock_session.request.return_value = create_async_context_manager(unavailable)
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(AutoPiAPIError) as exc_info,
+        ):
+            await client.get_vehicles()
+
+        assert not isinstance(exc_info.value, AutoPiRateLimitError)
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.data == {"response": "Down for maintenance"}
+        mock_sleep.assert_not_awaited()
+        assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_bounded(self, mock_session):
+        """Test the client never exceeds its in-flight request limit."""
+        client = AutoPiClient(
+            mock_session, "test_api_key", DEFAULT_BASE_URL, max_concurrent_requests=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def enter(*_args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            return response
+
+        async def leave(*_args):
+            nonlocal in_flight
+            in_flight -= 1
+
+        response = Mock()
+        response.status = 200
+        response.headers = {}
+        response.json = AsyncMock(return_value={"results": []})
+
+        def request(*_args, **_kwargs):
+            context = AsyncMock()
+            context.__aenter__.side_effect = enter
+            context.__aexit__.side_effect = leave
+            return context
+
+        mock_session.request.side_effect = request
+
+        await asyncio.gather(*(client.get_vehicles() for _ in range(5)))
+
+        assert mock_session.request.call_count == 5
+        assert peak == 2
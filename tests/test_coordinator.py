@@ -7,6 +7,7 @@ import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from contextlib import contextmanager
 
+from custom_components.autopi.auto_zero import AutoZeroManager
 from custom_components.autopi.const import DOMAIN
 from custom_components.autopi.coordinator import (
     AutoPiDataUpdateCoordinator,
@@ -498,6 +499,114 @@ class TestAutoPiPositionCoordinator:
             with pytest.raises(UpdateFailed, match="Failed to fetch data fields"):
                 await coordinator._async_update_data()
 
+    @pytest.mark.asyncio
+    async def test_fetch_position_data_evaluates_auto_zero(
+        self,
+        mock_hass,
+        mock_config_entry,
+        mock_client,
+        mock_vehicle,
+        mock_base_coordinator,
+    ):
+        """Test a position update zeroes stale tracked metrics."""
+        mock_base_coordinator.data = {"123": mock_vehicle}
+        mock_config_entry.options = {"auto_zero_enabled": True}
+        manager = AutoZeroManager()
+
+        with (
+            patch_autopi_dependencies(mock_client),
+            patch(
+                "custom_components.autopi.auto_zero.get_auto_zero_manager",
+                return_value=manager,
+            ),
+        ):
+            now = datetime.now(UTC)
+            mock_client.get_data_fields.return_value = {
+                "obd.rpm.value": DataFieldValue(
+                    field_prefix="obd.rpm",
+                    field_name="value",
+                    frequency=1.0,
+                    value_type="float",
+                    title="Engine RPM",
+                    last_seen=now - timedelta(minutes=30),
+                    last_value=850,
+                    description="",
+                    last_update=now,
+                ),
+                "obd.speed.value": DataFieldValue(
+                    field_prefix="obd.speed",
+                    field_name="value",
+                    frequency=1.0,
+                    value_type="float",
+                    title="Vehicle Speed",
+                    last_seen=now,
+                    last_value=40,
+                    description="",
+                    last_update=now,
+                ),
+            }
+
+            # Mock hass.data to avoid TypeErrors
+            mock_hass.data = {DOMAIN: {}}
+
+            coordinator = AutoPiPositionCoordinator(
+                mock_hass, mock_config_entry, mock_base_coordinator
+            )
+
+            await coordinator._async_update_data()
+
+        assert manager.is_metric_zeroed("123", "obd.rpm.value")
+        assert not manager.is_metric_zeroed("123", "obd.speed.value")
+
+    @pytest.mark.asyncio
+    async def test_fetch_position_data_survives_auto_zero_error(
+        self,
+        mock_hass,
+        mock_config_entry,
+        mock_client,
+        mock_vehicle,
+        mock_base_coordinator,
+    ):
+        """Test an auto-zero failure does not fail the position update."""
+        mock_base_coordinator.data = {"123": mock_vehicle}
+        mock_config_entry.options = {"auto_zero_enabled": True}
+        manager = Mock()
+        manager.evaluate_batch.side_effect = TypeError("naive timestamp")
+
+        with (
+            patch_autopi_dependencies(mock_client),
+            patch(
+                "custom_components.autopi.auto_zero.get_auto_zero_manager",
+                return_value=manager,
+            ),
+        ):
+            now = datetime.now(UTC)
+            mock_client.get_data_fields.return_value = {
+                "obd.rpm.value": DataFieldValue(
+                    field_prefix="obd.rpm",
+                    field_name="value",
+                    frequency=1.0,
+                    value_type="float",
+                    title="Engine RPM",
+                    last_seen=now,
+                    last_value=850,
+                    description="",
+                    last_update=now,
+                ),
+            }
+
+            # Mock hass.data to avoid TypeErrors
+            mock_hass.data = {DOMAIN: {}}
+
+            coordinator = AutoPiPositionCoordinator(
+                mock_hass, mock_config_entry, mock_base_coordinator
+            )
+
+            data = await coordinator._async_update_data()
+
+        manager.evaluate_batch.assert_called_once()
+        assert "obd.rpm.value" in data["123"].data_fields
+
     @pytest.mark.asyncio
     async def test_position_update_interval_from_options(
         self, mock_hass, mock_config_entry, mock_client, mock_base_coordinator
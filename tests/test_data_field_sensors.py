@@ -16,6 +16,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 
+from custom_components.autopi.auto_zero import AutoZeroManager
 from custom_components.autopi.const import DATA_FIELD_TIMEOUT_MINUTES
 from custom_components.autopi.data_field_sensors import (
     AmbientTemperatureSensor,
@@ -281,6 +282,28 @@ class TestSpecificSensors:
             sensor._attr_native_unit_of_measurement == UnitOfSpeed.KILOMETERS_PER_HOUR
         )
 
+    def test_auto_zeroed_metric_reads_zero(self, mock_coordinator, mock_vehicle):
+        """Test a tracked metric reads 0 only while auto-zero has it zeroed."""
+        field = create_data_field("obd.speed", "value", 60, "int")
+        mock_vehicle.data_fields = {"obd.speed.value": field}
+        mock_coordinator.data = {"123": mock_vehicle}
+        mock_coordinator.config_entry.options = {"auto_zero_enabled": True}
+        manager = AutoZeroManager()
+
+        sensor = OBDSpeedSensor(mock_coordinator, "123")
+
+        with patch(
+            "custom_components.autopi.data_field_sensors.get_auto_zero_manager",
+            return_value=manager,
+        ):
+            assert sensor.native_value == 60
+
+            manager._set_zeroed_at("123", "obd.speed.value", field.last_seen)
+            assert sensor.native_value == 0
+
+            mock_coordinator.config_entry.options = {"auto_zero_enabled": False}
+            assert sensor.native_value == 60
+
     def test_odometer_sensor_conversion(self, mock_coordinator, mock_vehicle):
         """Test odometer sensor converts meters to kilometers."""
         field = create_data_field("std.total_odometer", "value", 35767143, "int")
@@ -7,6 +7,7 @@ from unittest.mock import Mock
 import pytest
 from homeassistant.components.device_tracker import SourceType
 
+from custom_components.autopi import AutoPiEntryData
 from custom_components.autopi.device_tracker import AutoPiDeviceTracker
 from custom_components.autopi.types import (
     AutoPiVehicle,
@@ -219,9 +220,12 @@ class TestDeviceTrackerSetup:
 
         hass.data = {
             "autopi": {
-                "test_entry": {
-                    "position_coordinator": mock_coordinator,
-                }
+                "test_entry": AutoPiEntryData(
+                    base=Mock(),
+                    position=mock_coordinator,
+                    trip=Mock(),
+                    update_interval_minutes=1,
+                )
             }
         }
 
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.autopi import AutoPiEntryData
 from custom_components.autopi.const import DOMAIN
 from custom_components.autopi.coordinator import (
     ENDPOINT_KEY_OBD_DTCS,
@@ -250,7 +251,14 @@ async def test_event_setup_skips_unsupported_endpoints(hass: HomeAssistant):
 
     coordinator.is_endpoint_supported = MagicMock(side_effect=is_supported)
 
-    hass.data[DOMAIN] = {mock_entry.entry_id: {"coordinator": coordinator}}
+    hass.data[DOMAIN] = {
+        mock_entry.entry_id: AutoPiEntryData(
+            base=coordinator,
+            position=MagicMock(),
+            trip=MagicMock(),
+            update_interval_minutes=1,
+        )
+    }
 
     added_entities = []
 
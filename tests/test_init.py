@@ -2,31 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
 from custom_components.autopi.const import DOMAIN
 
 
-async def test_setup_entry(hass: HomeAssistant) -> None:
-    """Test setting up the integration."""
-    # Create a mock config entry
-    mock_entry = MagicMock()
-    mock_entry.entry_id = "test_entry_id"
-    mock_entry.domain = DOMAIN
-    mock_entry.title = "AutoPi"
-    mock_entry.data = {
+@pytest.fixture
+def mock_entry() -> MagicMock:
+    """Create a mock config entry for setup tests."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.domain = DOMAIN
+    entry.title = "AutoPi"
+    entry.data = {
         "api_key": "test_api_key",
         "base_url": "https://api.autopi.io",
         "selected_vehicles": ["123"],
         "scan_interval": 5,
     }
-    mock_entry.options = {}
-    mock_entry.add_update_listener = MagicMock(return_value=lambda: None)
-    mock_entry.async_on_unload = MagicMock()
+    entry.options = {}
+    entry.add_update_listener = MagicMock(return_value=lambda: None)
+    entry.async_on_unload = MagicMock()
+    return entry
 
-    # Mock the coordinator and its methods
+
+@pytest.fixture
+def mock_setup() -> Generator[SimpleNamespace]:
+    """Patch the coordinators, auto-zero manager and platform forwarding.
+
+    Yields the mocks the setup tests assert on.
+    """
     with (
         patch(
             "custom_components.autopi.AutoPiDataUpdateCoordinator"
@@ -40,6 +51,10 @@ async def test_setup_entry(hass: HomeAssistant) -> None:
         patch(
             "custom_components.autopi.get_auto_zero_manager"
         ) as mock_auto_zero_manager,
+        patch(
+            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+            return_value=None,
+        ),
     ):
         mock_coordinator = AsyncMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
@@ -66,21 +81,124 @@ async def test_setup_entry(hass: HomeAssistant) -> None:
         mock_auto_zero.async_initialize = AsyncMock()
         mock_auto_zero_manager.return_value = mock_auto_zero
 
-        # Mock platform setup
-        with patch(
-            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
-            return_value=None,
-        ):
-            # Test the setup
-            from custom_components.autopi import async_setup_entry
-
-            result = await async_setup_entry(hass, mock_entry)
-            assert result is True
-
-            # Verify the coordinator was created and stored
-            assert mock_entry.entry_id in hass.data[DOMAIN]
-            data = hass.data[DOMAIN][mock_entry.entry_id]
-            assert "coordinator" in data
-            assert "position_coordinator" in data
-            assert "coordinators" in data
-            assert data["coordinator"] == mock_coordinator
+        yield SimpleNamespace(
+            coordinator=mock_coordinator,
+            position_coordinator=mock_position_coordinator,
+            trip_coordinator=mock_trip_coordinator,
+            auto_zero=mock_auto_zero,
+        )
+
+
+async def test_setup_entry(
+    hass: HomeAssistant, mock_entry: MagicMock, mock_setup: SimpleNamespace
+) -> None:
+    """Test setting up the integration."""
+    from custom_components.autopi import async_setup_entry
+
+    result = await async_setup_entry(hass, mock_entry)
+    assert result is True
+
+    # Verify the coordinator was created and stored
+    assert mock_entry.entry_id in hass.data[DOMAIN]
+    data = hass.data[DOMAIN][mock_entry.entry_id]
+    assert data.base is mock_setup.coordinator
+    assert data.position is mock_setup.position_coordinator
+    assert data.trip is mock_setup.trip_coordinator
+    assert data.coordinators == {
+        "base": mock_setup.coordinator,
+        "position": mock_setup.position_coordinator,
+        "trip": mock_setup.trip_coordinator,
+    }
+
+    # Auto-zero storage is not loaded while the feature is disabled
+    mock_setup.auto_zero.async_initialize.assert_not_awaited()
+
+
+async def test_setup_entry_tolerates_position_failure(
+    hass: HomeAssistant, mock_entry: MagicMock, mock_setup: SimpleNamespace
+) -> None:
+    """Test setup continues when the concurrent position refresh fails."""
+    from custom_components.autopi import async_setup_entry
+
+    # async_config_entry_first_refresh raises ConfigEntryNotReady during setup
+    mock_setup.position_coordinator.async_config_entry_first_refresh.side_effect = (
+        ConfigEntryNotReady("boom")
+    )
+
+    assert await async_setup_entry(hass, mock_entry) is True
+    mock_setup.trip_coordinator.async_config_entry_first_refresh.assert_awaited_once()
+
+
+async def test_setup_entry_loads_auto_zero_before_position_refresh(
+    hass: HomeAssistant, mock_entry: MagicMock, mock_setup: SimpleNamespace
+) -> None:
+    """Test persisted auto-zero state is loaded before it is first evaluated."""
+    from custom_components.autopi import async_setup_entry
+
+    mock_entry.options = {"auto_zero_enabled": True}
+
+    async def position_refresh() -> None:
+        # The position refresh evaluates auto-zero against the loaded state
+        mock_setup.auto_zero.async_initialize.assert_awaited_once_with(hass)
+
+    first_refresh = mock_setup.position_coordinator.async_config_entry_first_refresh
+    first_refresh.side_effect = position_refresh
+
+    assert await async_setup_entry(hass, mock_entry) is True
+    first_refresh.assert_awaited_once()
+
+
+async def test_update_options_unchanged_interval_refreshes(
+    hass: HomeAssistant,
+) -> None:
+    """Test an options update without an interval change only refreshes."""
+    from custom_components.autopi import AutoPiEntryData, async_update_options
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.options = {"update_interval_fast": 1}
+
+    coordinators = [MagicMock() for _ in range(3)]
+    for coordinator in coordinators:
+        coordinator.async_request_refresh = AsyncMock()
+    hass.data[DOMAIN] = {
+        mock_entry.entry_id: AutoPiEntryData(
+            base=coordinators[0],
+            position=coordinators[1],
+            trip=coordinators[2],
+            update_interval_minutes=1,
+        )
+    }
+
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as mock_reload:
+        await async_update_options(hass, mock_entry)
+
+    for coordinator in coordinators:
+        coordinator.async_request_refresh.assert_awaited_once()
+    mock_reload.assert_not_awaited()
+
+
+async def test_update_options_changed_interval_reloads(hass: HomeAssistant) -> None:
+    """Test an options update with a new interval reloads the entry."""
+    from custom_components.autopi import AutoPiEntryData, async_update_options
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.options = {"update_interval_fast": 5}
+
+    coordinator = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+    hass.data[DOMAIN] = {
+        mock_entry.entry_id: AutoPiEntryData(
+            base=coordinator,
+            position=coordinator,
+            trip=coordinator,
+            update_interval_minutes=1,
+        )
+    }
+
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as mock_reload:
+        await async_update_options(hass, mock_entry)
+
+    mock_reload.assert_awaited_once_with(mock_entry.entry_id)
+    coordinator.async_request_refresh.assert_not_awaited()
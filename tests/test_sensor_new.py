@@ -9,6 +9,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from custom_components.autopi import AutoPiEntryData
 from custom_components.autopi.const import DOMAIN
 from custom_components.autopi.sensor import (
     AutoPiEventVolumeSensor,
@@ -404,19 +405,16 @@ class TestAsyncSetupEntry:
             str(mock_vehicle.id): vehicle_with_position,
         }
 
-        mock_trip_coordinator = None
+        mock_trip_coordinator = Mock(data={})
 
         # Setup hass data
         hass.data[DOMAIN] = {
-            "test_entry": {
-                "coordinator": mock_coordinator,
-                "position_coordinator": mock_position_coordinator,
-                "trip_coordinator": mock_trip_coordinator,
-                "coordinators": {
-                    "coordinator": mock_coordinator,
-                    "position_coordinator": mock_position_coordinator,
-                },
-            }
+            "test_entry": AutoPiEntryData(
+                base=mock_coordinator,
+                position=mock_position_coordinator,
+                trip=mock_trip_coordinator,
+                update_interval_minutes=1,
+            )
         }
 
         # Create mock config entry
@@ -458,15 +456,12 @@ class TestAsyncSetupEntry:
 
         # Setup hass data
         hass.data[DOMAIN] = {
-            "test_entry": {
-                "coordinator": mock_coordinator,
-                "position_coordinator": mock_position_coordinator,
-                "trip_coordinator": None,
-                "coordinators": {
-                    "coordinator": mock_coordinator,
-                    "position_coordinator": mock_position_coordinator,
-                },
-            }
+            "test_entry": AutoPiEntryData(
+                base=mock_coordinator,
+                position=mock_position_coordinator,
+                trip=Mock(data={}),
+                update_interval_minutes=1,
+            )
         }
 
         mock_entry = Mock()
@@ -520,15 +515,12 @@ class TestAsyncSetupEntry:
         )
 
         hass.data[DOMAIN] = {
-            "test_entry": {
-                "coordinator": mock_coordinator,
-                "position_coordinator": mock_position_coordinator,
-                "trip_coordinator": None,
-                "coordinators": {
-                    "coordinator": mock_coordinator,
-                    "position_coordinator": mock_position_coordinator,
-                },
-            }
+            "test_entry": AutoPiEntryData(
+                base=mock_coordinator,
+                position=mock_position_coordinator,
+                trip=Mock(data={}),
+                update_interval_minutes=1,
+            )
         }
 
         mock_entry = Mock()